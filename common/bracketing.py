@@ -0,0 +1,86 @@
+from decimal import ROUND_CEILING, Decimal
+from typing import Callable
+
+MAX_EVALUATIONS = 10001
+
+
+class BracketingException(Exception):
+    def __init__(self, *args):
+        super().__init__(*args)
+
+
+class FunctionEvaluator:
+    evaluations: int
+    max_evaluations: int
+
+    def __init__(self, function: Callable[[Decimal], Decimal], max_evaluations: int = MAX_EVALUATIONS):
+        self.function = function
+        self.evaluations = 0
+        self.max_evaluations = max_evaluations
+
+    def evaluate(self, point: Decimal):
+        if self.evaluations >= self.max_evaluations:
+            raise BracketingException(f'Limite de {self.max_evaluations} avaliações da função atingido')
+
+        self.evaluations += 1
+
+        return self.function(point)
+
+
+class BracketingState(FunctionEvaluator):
+    start: Decimal
+    end: Decimal
+    value_at_start: Decimal
+    value_at_end: Decimal
+
+    def __init__(self, function: Callable[[Decimal], Decimal], start: Decimal, end: Decimal, max_evaluations: int = MAX_EVALUATIONS):
+        if (end - start) < 0:
+            raise BracketingException('Intervalo Inválido')
+
+        super().__init__(function, max_evaluations)
+        self.start = start
+        self.end = end
+        self.value_at_start = self.evaluate(start)
+        self.value_at_end = self.evaluate(end)
+
+    def has_signal_change(self):
+        return (self.value_at_start * self.value_at_end) <= 0
+
+    def size(self):
+        return self.end - self.start
+
+    def update(self, point: Decimal, value: Decimal):
+        if (self.value_at_start * value) < 0:
+            self.end = point
+            self.value_at_end = value
+        elif (self.value_at_end * value) < 0:
+            self.start = point
+            self.value_at_start = value
+        elif value == 0:
+            self.start = point
+            self.end = point
+            self.value_at_start = value
+            self.value_at_end = value
+        else:
+            raise BracketingException('Não houve mudança de sinais, não é possível encontrar uma solução!')
+
+
+def get_bisection_iterations(interval_size: Decimal, tolerance: Decimal):
+    if interval_size <= tolerance:
+        return 1
+
+    iterations = int(((interval_size / tolerance).ln() / Decimal(2).ln()).to_integral_value(rounding=ROUND_CEILING))
+
+    if (interval_size / (2 ** (iterations - 1))) <= tolerance:
+        iterations -= 1
+
+    return iterations
+
+
+def get_golden_section_iterations(interval_size: Decimal, tolerance: Decimal):
+    if interval_size <= tolerance:
+        return 1
+
+    ratio = (Decimal(5).sqrt() - 1) / 2
+
+    return int(((tolerance / interval_size).ln() / ratio.ln()).to_integral_value(rounding=ROUND_CEILING))
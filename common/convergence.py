@@ -0,0 +1,13 @@
+from decimal import Decimal
+
+
+def get_convergence_order(errors: list[Decimal]):
+    if len(errors) < 3:
+        return None
+
+    error_before, previous_error, error = errors[-3:]
+
+    if error == 0 or previous_error == 0 or error_before == 0 or previous_error == error_before:
+        return None
+
+    return (error / previous_error).ln() / (previous_error / error_before).ln()
@@ -0,0 +1,119 @@
+from decimal import Decimal, getcontext
+from functools import lru_cache
+
+import mpmath
+import numpy as np
+from sympy import Expr, Function, diff, lambdify, symbols, sympify
+from sympy.printing.pycode import MpmathPrinter
+
+CACHE_SIZE = 256
+INTERVAL_FUNCTIONS = ("mpf", "sqrt", "exp", "log", "sin", "cos", "tan", "fabs", "pi", "e")
+INTERVAL_SYMPY_FUNCTIONS = ("exp", "log", "sin", "cos", "tan", "Abs")
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_expression(expression: str) -> Expr:
+    return sympify(expression, rational=True)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def compile_expression(expression: str, variables: tuple[str, ...], backend: str = "mpmath"):
+    symp_expression = parse_expression(expression)
+    symp_variables = [symbols(variable) for variable in variables]
+
+    return lambdify(symp_variables, symp_expression, modules=backend, cse=True)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def compile_expressions(expressions: tuple[str, ...], variables: tuple[str, ...], backend: str = "mpmath"):
+    symp_expressions = [parse_expression(expression) for expression in expressions]
+    symp_variables = [symbols(variable) for variable in variables]
+
+    return lambdify(symp_variables, symp_expressions, modules=backend, cse=True)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def compile_interval_expression(expression: str, variables: tuple[str, ...]):
+    symp_expression = parse_expression(expression)
+    symp_variables = [symbols(variable) for variable in variables]
+
+    for function in symp_expression.atoms(Function):
+        if function.func.__name__ not in INTERVAL_SYMPY_FUNCTIONS:
+            raise ValueError(f"Função não suportada na aritmética intervalar: {function.func.__name__}")
+
+    namespace = {name: getattr(mpmath.iv, name) for name in INTERVAL_FUNCTIONS}
+
+    return lambdify(symp_variables, symp_expression, modules=[namespace], printer=MpmathPrinter({"fully_qualified_modules": False, "inline": True, "allow_unknown_functions": True}), cse=True)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def differentiate_expression(expression: str, variable: str, order: int = 1):
+    return str(diff(parse_expression(expression), symbols(variable), order))
+
+
+def to_mpf(value: Decimal | int | float):
+    return mpmath.mpf(str(value))
+
+
+def solve_expression(expression: str, values: dict[str, Decimal]):
+    compiled = compile_expression(expression, tuple(values.keys()))
+
+    with mpmath.workdps(getcontext().prec):
+        result = compiled(*[to_mpf(value) for value in values.values()])
+
+        return Decimal(str(result))
+
+
+def solve_expression_complex(expression: str, values: dict[str, mpmath.mpc]):
+    compiled = compile_expression(expression, tuple(values.keys()))
+
+    with mpmath.workdps(getcontext().prec):
+        return mpmath.mpc(compiled(*[mpmath.mpc(value) for value in values.values()]))
+
+
+def to_interval(start: Decimal | int | float, end: Decimal | int | float | None = None):
+    if end is None:
+        return mpmath.iv.mpf(str(start))
+
+    return mpmath.iv.mpf([mpmath.iv.mpf(str(start)).a, mpmath.iv.mpf(str(end)).b])
+
+
+def solve_expression_interval(expression: str, values: dict[str, mpmath.ctx_iv.ivmpf]):
+    compiled = compile_interval_expression(expression, tuple(values.keys()))
+    previous_dps = mpmath.iv.dps
+    mpmath.iv.dps = getcontext().prec
+
+    try:
+        return compiled(*values.values())
+    finally:
+        mpmath.iv.dps = previous_dps
+
+
+def solve_expressions(expressions: tuple[str, ...], values: dict[str, Decimal]):
+    compiled = compile_expressions(expressions, tuple(values.keys()))
+
+    with mpmath.workdps(getcontext().prec):
+        results = compiled(*[to_mpf(value) for value in values.values()])
+
+        return [Decimal(str(result)) for result in results]
+
+
+def solve_expression_array(expression: str, values: dict[str, np.ndarray], dtype: type = float):
+    compiled = compile_expression(expression, tuple(values.keys()), "numpy")
+    arrays = [np.asarray(value, dtype=dtype) for value in values.values()]
+
+    with np.errstate(all="ignore"):
+        result = compiled(*arrays)
+
+    return np.broadcast_to(np.asarray(result, dtype=dtype), np.broadcast_shapes(*[array.shape for array in arrays])).copy()
+
+
+def solve_expressions_array(expressions: tuple[str, ...], values: dict[str, np.ndarray], dtype: type = float):
+    compiled = compile_expressions(expressions, tuple(values.keys()), "numpy")
+    arrays = [np.asarray(value, dtype=dtype) for value in values.values()]
+    shape = np.broadcast_shapes(*[array.shape for array in arrays])
+
+    with np.errstate(all="ignore"):
+        results = compiled(*arrays)
+
+    return [np.broadcast_to(np.asarray(result, dtype=dtype), shape).copy() for result in results]
@@ -0,0 +1,292 @@
+from dataclasses import dataclass
+from decimal import Decimal
+from enum import Enum
+from fractions import Fraction
+import hashlib
+import math
+import struct
+import zipfile
+
+import numpy as np
+
+ZIP_LOCAL_HEADER_SIZE = 30
+LU_BLOCK_SIZE = 64
+
+
+class PivotingType(Enum):
+    NONE = 1
+    PARTIAL = 2
+    SCALED_PARTIAL = 3
+
+
+class LinearSystemException(Exception):
+    def __init__(self, *args):
+        super().__init__(*args)
+
+
+def to_array(values):
+    array = np.array(values)
+
+    if array.dtype.kind in "biu":
+        return array.astype(float)
+
+    return array
+
+
+def get_pivot_row(matrix: np.ndarray, column: int, pivoting: PivotingType, scales: np.ndarray | None):
+    if pivoting == PivotingType.NONE:
+        return column
+
+    candidates = np.abs(matrix[column:, column])
+    if pivoting == PivotingType.SCALED_PARTIAL:
+        candidates = candidates / scales[column:]
+
+    return column + int(np.argmax(candidates))
+
+
+def forward_elimination(matrix: np.ndarray, results: np.ndarray, pivoting: PivotingType = PivotingType.PARTIAL):
+    size = len(results)
+    permutation = np.arange(size)
+    scales = None
+
+    if pivoting == PivotingType.SCALED_PARTIAL:
+        scales = np.max(np.abs(matrix), axis=1)
+        if np.any(scales == 0):
+            raise LinearSystemException("A matriz possui uma linha nula, não é possível resolver o sistema")
+
+    for column in range(size - 1):
+        pivot = get_pivot_row(matrix, column, pivoting, scales)
+
+        if matrix[pivot, column] == 0:
+            raise LinearSystemException(f"Pivô nulo na coluna {column + 1}, não é possível resolver o sistema")
+
+        if pivot != column:
+            matrix[[column, pivot]] = matrix[[pivot, column]]
+            results[[column, pivot]] = results[[pivot, column]]
+            permutation[[column, pivot]] = permutation[[pivot, column]]
+            if scales is not None:
+                scales[[column, pivot]] = scales[[pivot, column]]
+
+        multipliers = matrix[column + 1:, column] / matrix[column, column]
+        matrix[column + 1:, column + 1:] -= np.outer(multipliers, matrix[column, column + 1:])
+        results[column + 1:] -= multipliers * results[column]
+        matrix[column + 1:, column] = 0
+
+    return permutation
+
+
+def to_exact_array(values):
+    return np.frompyfunc(lambda value: Fraction(str(value)), 1, 1)(np.array(values, dtype=object))
+
+
+def to_integer_rows(matrix: np.ndarray, results: np.ndarray):
+    scales = np.array([math.lcm(*(value.denominator for value in row), value.denominator) for row, value in zip(matrix, results)], dtype=object)
+
+    integer_matrix = np.frompyfunc(int, 1, 1)(matrix * scales[:, None])
+    integer_results = np.frompyfunc(int, 1, 1)(results * scales)
+
+    return integer_matrix, integer_results, math.prod(scales)
+
+
+def fraction_free_elimination(matrix: np.ndarray, results: np.ndarray):
+    size = len(results)
+    permutation = np.arange(size)
+    sign = 1
+    previous_pivot = 1
+
+    for column in range(size - 1):
+        nonzero = np.flatnonzero(matrix[column:, column] != 0)
+
+        if len(nonzero) == 0:
+            return permutation, 0
+
+        pivot = column + int(nonzero[0])
+        if pivot != column:
+            matrix[[column, pivot]] = matrix[[pivot, column]]
+            results[[column, pivot]] = results[[pivot, column]]
+            permutation[[column, pivot]] = permutation[[pivot, column]]
+            sign = -sign
+
+        multipliers = matrix[column + 1:, column].copy()
+        matrix[column + 1:, column + 1:] = (matrix[column + 1:, column + 1:] * matrix[column, column] - np.outer(multipliers, matrix[column, column + 1:])) // previous_pivot
+        results[column + 1:] = (results[column + 1:] * matrix[column, column] - multipliers * results[column]) // previous_pivot
+        matrix[column + 1:, column] = 0
+        previous_pivot = matrix[column, column]
+
+    return permutation, sign * matrix[size - 1, size - 1]
+
+
+def bareiss_solve(matrix, results):
+    integer_matrix, integer_results, scale = to_integer_rows(to_exact_array(matrix), to_exact_array(results))
+    permutation, integer_determinant = fraction_free_elimination(integer_matrix, integer_results)
+
+    if integer_determinant == 0:
+        raise LinearSystemException("O determinante da matriz é zero, o sistema não possui solução única")
+
+    solution = back_substitution(integer_matrix, to_exact_array(integer_results))
+
+    return ExactSolution(solution, Fraction(integer_determinant, scale), integer_matrix, integer_results, permutation)
+
+
+def forward_substitution(matrix, results):
+    matrix = np.asarray(matrix)
+    results = np.asarray(results)
+    solution = np.zeros(results.shape, dtype=np.result_type(matrix, results))
+
+    for row in range(len(results)):
+        if matrix[row, row] == 0:
+            raise LinearSystemException(f"Pivô nulo na linha {row + 1}, não é possível resolver o sistema")
+
+        solution[row] = (results[row] - (matrix[row, :row] @ solution[:row])) / matrix[row, row]
+
+    return solution
+
+
+def back_substitution(matrix, results):
+    matrix = np.asarray(matrix)
+    results = np.asarray(results)
+    solution = np.zeros(results.shape, dtype=np.result_type(matrix, results))
+
+    for row in range(len(results) - 1, -1, -1):
+        if matrix[row, row] == 0:
+            raise LinearSystemException(f"Pivô nulo na linha {row + 1}, não é possível resolver o sistema")
+
+        solution[row] = (results[row] - (matrix[row, row + 1:] @ solution[row + 1:])) / matrix[row, row]
+
+    return solution
+
+
+def factorize_panel(matrix: np.ndarray, permutation: np.ndarray, start: int, end: int):
+    for column in range(start, end):
+        pivot = column + int(np.argmax(np.abs(matrix[column:, column])))
+
+        if matrix[pivot, column] == 0:
+            raise LinearSystemException(f"A matriz é singular, pivô nulo na coluna {column + 1}")
+
+        if pivot != column:
+            matrix[[column, pivot]] = matrix[[pivot, column]]
+            permutation[[column, pivot]] = permutation[[pivot, column]]
+
+        matrix[column + 1:, column] /= matrix[column, column]
+        matrix[column + 1:, column + 1:end] -= np.outer(matrix[column + 1:, column], matrix[column, column + 1:end])
+
+
+def blocked_lu(matrix, block_size: int = LU_BLOCK_SIZE):
+    matrix = np.array(matrix, dtype=np.float64)
+    size = len(matrix)
+    permutation = np.arange(size)
+
+    if matrix.ndim != 2 or matrix.shape[1] != size:
+        raise LinearSystemException("A matriz não é quadrada")
+
+    for start in range(0, size, block_size):
+        end = min(start + block_size, size)
+        factorize_panel(matrix, permutation, start, end)
+
+        if end < size:
+            panel_lower = np.tril(matrix[start:end, start:end], -1) + np.eye(end - start)
+            matrix[start:end, end:] = forward_substitution(panel_lower, matrix[start:end, end:])
+            matrix[end:, end:] -= matrix[end:, start:end] @ matrix[start:end, end:]
+
+    return LUFactorization(np.tril(matrix, -1) + np.eye(size), np.triu(matrix), permutation)
+
+
+def get_matrix_signature(matrix):
+    array = np.asarray(matrix)
+    content = ";".join(str(value) for value in array.flat)
+
+    return hashlib.sha256(f"{array.shape}|{content}".encode()).hexdigest()
+
+
+def to_decimal_array(values: np.ndarray):
+    return np.frompyfunc(Decimal, 1, 1)(values)
+
+
+def load_npz(file_path: str, mmap: bool = True):
+    if not mmap:
+        with np.load(file_path) as arrays:
+            return {name: arrays[name] for name in arrays.files}
+
+    arrays = {}
+    with zipfile.ZipFile(file_path) as archive, open(file_path, "rb") as file:
+        for info in archive.infolist():
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise LinearSystemException(f"O arquivo {file_path} está comprimido e não pode ser mapeado em memória")
+
+            file.seek(info.header_offset)
+            name_length, extra_length = struct.unpack("<HH", file.read(ZIP_LOCAL_HEADER_SIZE)[26:30])
+            file.seek(info.header_offset + ZIP_LOCAL_HEADER_SIZE + name_length + extra_length)
+
+            version = np.lib.format.read_magic(file)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(file)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(file)
+
+            arrays[info.filename.removesuffix(".npy")] = np.memmap(file_path, dtype=dtype, mode="r", offset=file.tell(), shape=shape, order="F" if fortran_order else "C")
+
+    return arrays
+
+
+@dataclass
+class ExactSolution:
+    solution: np.ndarray
+    determinant: Fraction
+    matrix: np.ndarray
+    results: np.ndarray
+    permutation: np.ndarray
+
+
+class LUFactorization:
+    lower: np.ndarray
+    upper: np.ndarray
+    permutation: np.ndarray
+    signature: str | None
+
+    def __init__(self, lower, upper, permutation=None, signature=None):
+        self.lower = np.asarray(lower)
+        self.upper = np.asarray(upper)
+        self.permutation = np.asarray(permutation) if permutation is not None else np.arange(len(self.lower))
+        self.signature = signature
+
+    def matches(self, matrix, is_decimal: bool):
+        return (
+            self.signature == get_matrix_signature(matrix)
+            and self.lower.shape == np.shape(matrix)
+            and (self.lower.dtype == object) == is_decimal
+        )
+
+    def forward(self, results):
+        return forward_substitution(self.lower, np.asarray(results)[self.permutation])
+
+    def backward(self, intermediate):
+        return back_substitution(self.upper, intermediate)
+
+    def solve(self, results):
+        return self.backward(self.forward(results))
+
+    def save(self, file_path: str):
+        is_decimal = self.lower.dtype == object
+
+        np.savez(
+            file_path,
+            lower=self.lower.astype(str) if is_decimal else self.lower,
+            upper=self.upper.astype(str) if is_decimal else self.upper,
+            permutation=self.permutation,
+            decimal=np.array([is_decimal]),
+            shape=np.array(self.lower.shape),
+            signature=np.array([self.signature or ""])
+        )
+
+    @classmethod
+    def load(cls, file_path: str, mmap: bool = True):
+        arrays = load_npz(file_path, mmap)
+        signature = str(arrays["signature"][0]) if "signature" in arrays else None
+
+        if "shape" in arrays and tuple(arrays["shape"]) != arrays["lower"].shape:
+            raise LinearSystemException(f"O arquivo {file_path} está corrompido: dimensões inconsistentes")
+
+        if arrays["decimal"][0]:
+            return cls(to_decimal_array(arrays["lower"]), to_decimal_array(arrays["upper"]), np.array(arrays["permutation"]), signature)
+
+        return cls(arrays["lower"], arrays["upper"], arrays["permutation"], signature)
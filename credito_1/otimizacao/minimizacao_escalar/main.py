@@ -0,0 +1,283 @@
+from dataclasses import dataclass
+from enum import Enum
+import os
+import sys
+import json
+from decimal import Decimal, getcontext
+
+sys.path.append(os.path.realpath(f'{os.path.dirname(os.path.realpath(__file__))}/../../..'))
+
+from common.bracketing import MAX_EVALUATIONS, BracketingException, FunctionEvaluator, get_golden_section_iterations
+from common.expressions import differentiate_expression, solve_expression, solve_expressions
+
+getcontext().prec = 50
+
+GOLDEN_RATIO = (Decimal(5).sqrt() - 1) / 2
+GOLDEN_STEP = 1 - GOLDEN_RATIO
+RELATIVE_TOLERANCE = Decimal('1e-40')
+
+class StopConditionType(Enum):
+    ERROR = 1
+    INTERVALSIZE = 2
+
+class MethodType(Enum):
+    GOLDEN_SECTION = 1
+    BRENT = 2
+    NEWTON = 3
+
+class StepType(Enum):
+    GOLDEN_SECTION = 'seção áurea'
+    PARABOLIC = 'parabólico'
+    NEWTON = 'newton'
+
+@dataclass
+class Function:
+    expression: str
+    variable: str
+
+@dataclass 
+class Interval:
+    start: Decimal
+    end: Decimal
+
+@dataclass 
+class StopCondition:
+    type: StopConditionType
+    value: Decimal
+
+@dataclass
+class InputData:
+    function: Function
+    interval: Interval
+    stop_condition: StopCondition
+    method: MethodType
+    max_evaluations: int
+
+    def __init__(self, function: Function, interval: Interval, stop_condition: StopCondition, method: MethodType = MethodType.GOLDEN_SECTION, max_evaluations: int = MAX_EVALUATIONS):
+        self.function = function
+        self.interval = interval
+        self.stop_condition = stop_condition
+        self.method = method
+        self.max_evaluations = max_evaluations
+
+    def __str__(self):
+        return f'f({self.function.variable}) = {self.function.expression}; [{self.interval.start}, {self.interval.end}]'
+
+@dataclass
+class Solution:
+    interval: Interval
+    point: Decimal
+    value: Decimal
+    error: Decimal
+    evaluations: int
+
+class SolutionException(Exception):
+    def __init__(self, *args):
+        super().__init__(*args)
+
+def get_data_from_json(file_path: str):
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    
+    with open(f'{dir_path}/{file_path}', 'r') as json_file:
+        data = json.load(json_file)
+
+    if('error' in data['stop_condition']):
+        stop_condition = StopCondition(StopConditionType.ERROR, Decimal(str(data['stop_condition']['error'])))
+    elif('interval_size' in data['stop_condition']):
+        stop_condition = StopCondition(StopConditionType.INTERVALSIZE, Decimal(str(data['stop_condition']['interval_size'])))
+    else:
+        raise(KeyError('Forneça uma condição de parada no arquivo de entrada. Valores aceitos: "error" ou "interval_size"'))
+
+    return InputData(
+        Function(data['function']['expression'], data['function']['variable']), 
+        Interval(Decimal(str(data['interval']['start'])), Decimal(str(data['interval']['end']))),
+        stop_condition,
+        MethodType[data['method'].upper()] if 'method' in data else MethodType.GOLDEN_SECTION,
+        data['max_evaluations'] if 'max_evaluations' in data else MAX_EVALUATIONS
+    )
+
+def get_out_file(file_path: str):
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    file = open(f'{dir_path}/{file_path}', 'w')
+
+    return file
+
+def solve_function(function: Function, variable_value: Decimal):
+    return solve_expression(function.expression, {function.variable: variable_value})
+
+def check_interval(interval: Interval):
+    if (interval.end - interval.start) <= 0:
+        raise SolutionException('Intervalo Inválido')
+
+def golden_section_solve(function: Function, interval: Interval, stop_condition: StopCondition, max_evaluations: int = MAX_EVALUATIONS):
+    OUTPUT_FILE.write('#;a;b;c;d;f(c);f(d)\n')
+    check_interval(interval)
+
+    evaluator = FunctionEvaluator(lambda value: solve_function(function, value), max_evaluations)
+    start, end = interval.start, interval.end
+    left = end - (GOLDEN_RATIO * (end - start))
+    right = start + (GOLDEN_RATIO * (end - start))
+    value_at_left = evaluator.evaluate(left)
+    value_at_right = evaluator.evaluate(right)
+
+    max_iterations = get_golden_section_iterations(end - start, stop_condition.value)
+    if max_iterations > 9999:
+        raise SolutionException("Não foi possível encontrar um resultado em 9999 iterações")
+
+    iteration = 0
+    error = end - start
+
+    while error > stop_condition.value and iteration < max_iterations:
+        iteration += 1
+        OUTPUT_FILE.write(f'{iteration};{start:.15f};{end:.15f};{left:.15f};{right:.15f};{value_at_left:.15f};{value_at_right:.15f} \n'.replace('.', ','))
+
+        if value_at_left < value_at_right:
+            end, right, value_at_right = right, left, value_at_left
+            left = end - (GOLDEN_RATIO * (end - start))
+            value_at_left = evaluator.evaluate(left)
+        else:
+            start, left, value_at_left = left, right, value_at_right
+            right = start + (GOLDEN_RATIO * (end - start))
+            value_at_right = evaluator.evaluate(right)
+
+        error = end - start
+
+    if error > stop_condition.value:
+        raise SolutionException(f"Não foi possível encontrar um resultado em {max_iterations} iterações")
+
+    best = left if value_at_left < value_at_right else right
+
+    return Solution(Interval(start, end), best, min(value_at_left, value_at_right), error, evaluator.evaluations)
+
+def brent_solve(function: Function, interval: Interval, stop_condition: StopCondition, max_evaluations: int = MAX_EVALUATIONS):
+    OUTPUT_FILE.write('#;a;b;x;f(x);u;f(u);passo\n')
+    check_interval(interval)
+
+    evaluator = FunctionEvaluator(lambda value: solve_function(function, value), max_evaluations)
+    start, end = interval.start, interval.end
+    best = second_best = previous_second_best = start + (GOLDEN_STEP * (end - start))
+    value_at_best = value_at_second_best = value_at_previous_second_best = evaluator.evaluate(best)
+    step = previous_step = Decimal(0)
+
+    for iteration in range(1, 10000):
+        middle = (start + end) / 2
+        tolerance = (stop_condition.value / 2) + (RELATIVE_TOLERANCE * abs(best))
+
+        if abs(best - middle) <= (2 * tolerance) - ((end - start) / 2):
+            return Solution(Interval(start, end), best, value_at_best, end - start, evaluator.evaluations)
+
+        step_type = StepType.GOLDEN_SECTION
+        if abs(previous_step) > tolerance:
+            r = (best - second_best) * (value_at_best - value_at_previous_second_best)
+            q = (best - previous_second_best) * (value_at_best - value_at_second_best)
+            p = ((best - previous_second_best) * q) - ((best - second_best) * r)
+            q = 2 * (q - r)
+            if q > 0:
+                p = -p
+            q = abs(q)
+
+            if abs(p) < abs(q * previous_step / 2) and (q * (start - best)) < p < (q * (end - best)):
+                previous_step, step = step, p / q
+                candidate = best + step
+                if (candidate - start) < (2 * tolerance) or (end - candidate) < (2 * tolerance):
+                    step = tolerance if middle >= best else -tolerance
+                step_type = StepType.PARABOLIC
+
+        if step_type == StepType.GOLDEN_SECTION:
+            previous_step = (start - best) if best >= middle else (end - best)
+            step = GOLDEN_STEP * previous_step
+
+        candidate = best + step if abs(step) >= tolerance else best + (tolerance if step >= 0 else -tolerance)
+        value_at_candidate = evaluator.evaluate(candidate)
+
+        OUTPUT_FILE.write(f'{iteration};{start:.15f};{end:.15f};{best:.15f};{value_at_best:.15f};{candidate:.15f};{value_at_candidate:.15f};{step_type.value} \n'.replace('.', ','))
+
+        if value_at_candidate <= value_at_best:
+            if candidate >= best:
+                start = best
+            else:
+                end = best
+            previous_second_best, value_at_previous_second_best = second_best, value_at_second_best
+            second_best, value_at_second_best = best, value_at_best
+            best, value_at_best = candidate, value_at_candidate
+        else:
+            if candidate < best:
+                start = candidate
+            else:
+                end = candidate
+
+            if value_at_candidate <= value_at_second_best or second_best == best:
+                previous_second_best, value_at_previous_second_best = second_best, value_at_second_best
+                second_best, value_at_second_best = candidate, value_at_candidate
+            elif value_at_candidate <= value_at_previous_second_best or previous_second_best == best or previous_second_best == second_best:
+                previous_second_best, value_at_previous_second_best = candidate, value_at_candidate
+
+    raise SolutionException("Não foi possível encontrar um resultado em 9999 iterações")
+
+def newton_solve(function: Function, interval: Interval, stop_condition: StopCondition, max_evaluations: int = MAX_EVALUATIONS):
+    OUTPUT_FILE.write('#;a;b;x;f(x);f\'(x);f\'\'(x);x[k+1];x[k+1] - x[k];passo\n')
+    check_interval(interval)
+
+    differential = differentiate_expression(function.expression, function.variable)
+    second_differential = differentiate_expression(function.expression, function.variable, 2)
+    evaluator = FunctionEvaluator(lambda value: solve_expressions((function.expression, differential, second_differential), {function.variable: value}), max_evaluations)
+
+    start, end = interval.start, interval.end
+    point = (start + end) / 2
+    for iteration in range(1, 10000):
+        solution_for_function, solution_for_differential, solution_for_second_differential = evaluator.evaluate(point)
+
+        if solution_for_differential > 0:
+            end = point
+        elif solution_for_differential < 0:
+            start = point
+
+        next_point = None
+        if solution_for_second_differential > 0:
+            next_point = point - (solution_for_differential / solution_for_second_differential)
+
+        if next_point is not None and start <= next_point <= end:
+            step_type = StepType.NEWTON
+        else:
+            step_type = StepType.GOLDEN_SECTION
+            next_point = point + (GOLDEN_STEP * ((start - point) if solution_for_differential > 0 else (end - point)))
+
+        error = abs(next_point - point)
+
+        OUTPUT_FILE.write(f'{iteration};{start:.15f};{end:.15f};{point:.15f};{solution_for_function:.15f};{solution_for_differential:.15f};{solution_for_second_differential:.15f};{next_point:.15f};{error:.15f};{step_type.value} \n'.replace('.', ','))
+
+        if error <= stop_condition.value:
+            return Solution(Interval(start, end), next_point, solve_function(function, next_point), error, evaluator.evaluations)
+
+        point = next_point
+
+    raise SolutionException("Não foi possível encontrar um resultado em 9999 iterações")
+
+def minimization_solve(function: Function, interval: Interval, stop_condition: StopCondition, method: MethodType = MethodType.GOLDEN_SECTION, max_evaluations: int = MAX_EVALUATIONS):
+    if method == MethodType.BRENT:
+        return brent_solve(function, interval, stop_condition, max_evaluations)
+    if method == MethodType.NEWTON:
+        return newton_solve(function, interval, stop_condition, max_evaluations)
+
+    return golden_section_solve(function, interval, stop_condition, max_evaluations)
+
+INPUT_PATH = 'input.json'
+OUTPUT_PATH = 'output.csv'
+OUTPUT_FILE = get_out_file(OUTPUT_PATH)
+
+if __name__ == '__main__':
+    
+    try:
+        data = get_data_from_json(INPUT_PATH)
+        solution = minimization_solve(data.function, data.interval, data.stop_condition, data.method, data.max_evaluations)
+        print(f"Solução encontrada e escrita no arquivo {OUTPUT_PATH}")
+        print(f"Ponto de mínimo: {data.function.variable} = {solution.point:.15f}; f({data.function.variable}) = {solution.value:.15f}")
+        print(f"Avaliações da função: {solution.evaluations}")
+    except (SolutionException, BracketingException) as ex:
+        print(ex)
+    except KeyError as e:
+        print(f"Formato de entrada inválido. Chave faltando: {e}")
+    except Exception as e:
+        print(f'Erro ao solucionar o problema: {e}')
+    
+    OUTPUT_FILE.close()
@@ -0,0 +1,245 @@
+from dataclasses import dataclass
+import importlib.util
+import io
+import os
+import sys
+import json
+import time
+from decimal import Decimal, getcontext
+
+sys.path.append(os.path.realpath(f'{os.path.dirname(os.path.realpath(__file__))}/../../..'))
+
+from common.convergence import get_convergence_order
+from common.expressions import solve_expression
+
+getcontext().prec = 50
+
+METHODS = ('bisseccao', 'posicao_falsa', 'illinois', 'pegasus', 'anderson-bjorck', 'brent', 'secante', 'muller', 'steffensen', 'newton-raphson')
+FALSE_POSITION_MODIFICATIONS = {'posicao_falsa': 'STANDARD', 'illinois': 'ILLINOIS', 'pegasus': 'PEGASUS', 'anderson-bjorck': 'ANDERSON_BJORCK'}
+EVALUATIONS_PER_ITERATE = {'steffensen': 2}
+RESIDUAL_FACTOR = 10
+REFERENCE_DISTANCE = Decimal('0.1')
+
+@dataclass
+class BenchmarkFunction:
+    name: str
+    expression: str
+    variable: str
+    start: Decimal
+    end: Decimal
+    starting_point: Decimal
+    root: Decimal | None
+
+@dataclass
+class InputData:
+    functions: list[BenchmarkFunction]
+    tolerances: list[Decimal]
+
+@dataclass
+class Result:
+    function: str
+    method: str
+    tolerance: Decimal
+    root: Decimal | None
+    error: Decimal | None
+    iterations: int | None
+    function_evaluations: int
+    derivative_evaluations: int
+    convergence_order: Decimal | None
+    time: float
+    failure: str | None
+
+    def to_dict(self):
+        return {
+            'funcao': self.function,
+            'metodo': self.method,
+            'tolerancia': f'{self.tolerance:.0e}',
+            'raiz': f'{self.root:.15f}' if self.root is not None else None,
+            'erro': f'{self.error:.3e}' if self.error is not None else None,
+            'iteracoes': self.iterations,
+            'avaliacoes_funcao': self.function_evaluations,
+            'avaliacoes_derivada': self.derivative_evaluations,
+            'ordem_observada': f'{self.convergence_order:.3f}' if self.convergence_order is not None else None,
+            'tempo_ms': round(self.time * 1000, 3),
+            'falha': self.failure
+        }
+
+class EvaluationCounter:
+    def __init__(self, module, expression: str):
+        self.module = module
+        self.expression = expression
+        self.originals = {name: getattr(module, name) for name in ('solve_expression', 'solve_expression_complex', 'solve_expressions') if hasattr(module, name)}
+        self.reset()
+
+    def reset(self):
+        self.function_evaluations = 0
+        self.derivative_evaluations = 0
+        self.points = []
+
+    def count(self, expression: str, values: dict[str, Decimal]):
+        if expression == self.expression:
+            self.function_evaluations += 1
+            point = next(iter(values.values()))
+            if len(self.points) == 0 or self.points[-1] != point:
+                self.points.append(point)
+        else:
+            self.derivative_evaluations += 1
+
+    def get_counted(self, name: str, original):
+        if name == 'solve_expressions':
+            def counted_solve_expressions(expressions: tuple[str, ...], values: dict[str, Decimal]):
+                for expression in expressions:
+                    self.count(expression, values)
+                return original(expressions, values)
+
+            return counted_solve_expressions
+
+        def counted_solve_expression(expression: str, values: dict[str, Decimal]):
+            self.count(expression, values)
+            return original(expression, values)
+
+        return counted_solve_expression
+
+    def __enter__(self):
+        for name, original in self.originals.items():
+            setattr(self.module, name, self.get_counted(name, original))
+        return self
+
+    def __exit__(self, *args):
+        for name, original in self.originals.items():
+            setattr(self.module, name, original)
+
+def get_data_from_json(file_path: str):
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    
+    with open(f'{dir_path}/{file_path}', 'r') as json_file:
+        data = json.load(json_file)
+
+    functions = [BenchmarkFunction(
+        function['name'],
+        function['expression'],
+        function['variable'],
+        Decimal(str(function['interval']['start'])),
+        Decimal(str(function['interval']['end'])),
+        Decimal(str(function['starting_point'])),
+        Decimal(function['root']) if 'root' in function else None
+    ) for function in data['functions']]
+
+    return InputData(functions, [Decimal(str(tolerance)) for tolerance in data['tolerances']])
+
+def get_out_file(file_path: str):
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    file = open(f'{dir_path}/{file_path}', 'w')
+
+    return file
+
+def get_module_name(method: str):
+    return 'posicao_falsa' if method in FALSE_POSITION_MODIFICATIONS else method
+
+def load_method(method: str):
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    spec = importlib.util.spec_from_file_location(f'benchmark_{method.replace("-", "_")}', f'{dir_path}/../{method}/main.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    return module
+
+def run_method(method: str, module, function: BenchmarkFunction, tolerance: Decimal):
+    stop_condition = module.StopCondition(module.StopConditionType.ERROR, tolerance)
+
+    if method == 'bisseccao':
+        solution = module.bissection_solve(module.Function(function.expression, function.variable), module.Interval(function.start, function.end), stop_condition)
+        return solution.value, solution.iterations
+    if method in FALSE_POSITION_MODIFICATIONS:
+        solution = module.false_position_solve(module.Function(function.expression, function.variable), module.Interval(function.start, function.end), stop_condition, modification=module.ModificationType[FALSE_POSITION_MODIFICATIONS[method]])
+        return solution.point, solution.iterations
+    if method == 'brent':
+        solution = module.brent_solve(module.Function(function.expression, function.variable), module.Interval(function.start, function.end), stop_condition)
+        return solution.value, solution.iterations
+    if method == 'secante':
+        solution = module.newton_raphson_solve(module.Function(function.expression, None, function.variable), function.start, function.end, stop_condition)
+        return solution.next_point, solution.iterations
+    if method == 'muller':
+        solution = module.muller_solve(module.Function(function.expression, function.variable), function.start, function.end, (function.start + function.end) / 2, stop_condition)
+        return Decimal(str(solution.next_point.real)), solution.iterations
+    if method == 'steffensen':
+        solution = module.steffensen_solve(module.Function(function.expression, function.variable), function.starting_point, stop_condition)
+        return solution.next_point, solution.iterations
+
+    solution = module.newton_raphson_solve(module.Function(function.expression, None, function.variable), function.starting_point, stop_condition)
+    return solution.next_point, solution.iterations
+
+def get_step_errors(points: list[Decimal]):
+    return [Decimal(str(abs(points[k] - points[k - 1]))) for k in range(1, len(points))]
+
+def check_root(function: BenchmarkFunction, root: Decimal, error: Decimal | None, tolerance: Decimal):
+    residual = abs(solve_expression(function.expression, {function.variable: root}))
+
+    if residual > RESIDUAL_FACTOR * tolerance:
+        return f'raiz falsa: |f({function.variable})| = {residual:.3e}'
+    if error is not None and error > REFERENCE_DISTANCE * max(abs(function.root), Decimal(1)):
+        return f'raiz distante da referência: |{function.variable} - {function.root}| = {error:.3e}'
+
+    return None
+
+def benchmark_method(method: str, module, function: BenchmarkFunction, tolerance: Decimal):
+    module.OUTPUT_FILE = io.StringIO()
+    try:
+        run_method(method, module, function, tolerance)
+    except Exception:
+        pass
+
+    module.OUTPUT_FILE = io.StringIO()
+    root = None
+    iterations = None
+    failure = None
+
+    with EvaluationCounter(module, function.expression) as counter:
+        start = time.perf_counter()
+        try:
+            root, iterations = run_method(method, module, function, tolerance)
+        except Exception as e:
+            failure = type(e).__name__ if isinstance(e, ArithmeticError) else str(e)
+        elapsed = time.perf_counter() - start
+
+    error = abs(root - function.root) if root is not None and function.root is not None else None
+    if failure is None:
+        failure = check_root(function, root, error, tolerance)
+
+    return Result(function.name, method, tolerance, root, error, iterations, counter.function_evaluations, counter.derivative_evaluations, get_convergence_order(get_step_errors(counter.points[::EVALUATIONS_PER_ITERATE.get(method, 1)])), elapsed, failure)
+
+def benchmark_solve(functions: list[BenchmarkFunction], tolerances: list[Decimal]):
+    modules = {method: load_method(get_module_name(method)) for method in METHODS}
+    results = []
+
+    for function in functions:
+        for tolerance in tolerances:
+            for method in METHODS:
+                results.append(benchmark_method(method, modules[method], function, tolerance))
+
+    return results
+
+INPUT_PATH = 'input.json'
+OUTPUT_PATH = 'report.json'
+
+if __name__ == '__main__':
+    
+    try:
+        data = get_data_from_json(INPUT_PATH)
+        results = benchmark_solve(data.functions, data.tolerances)
+
+        with get_out_file(OUTPUT_PATH) as output_file:
+            json.dump({'resultados': [result.to_dict() for result in results]}, output_file, indent=4, ensure_ascii=False)
+            output_file.write('\n')
+
+        print(f"{'função':<20}{'método':<16}{'tolerância':>12}{'iterações':>11}{'avaliações':>12}{'ordem':>8}{'tempo (ms)':>12}")
+        for result in results:
+            order = f'{result.convergence_order:.3f}' if result.convergence_order is not None else '-'
+            iterations = result.iterations if result.iterations is not None else '-'
+            status = '' if result.failure is None else f'  falha: {result.failure}'
+            print(f"{result.function:<20}{result.method:<16}{result.tolerance:>12.0e}{iterations:>11}{result.function_evaluations + result.derivative_evaluations:>12}{order:>8}{result.time * 1000:>12.3f}{status}")
+        print(f"Relatório escrito no arquivo {OUTPUT_PATH}")
+    except KeyError as e:
+        print(f"Formato de entrada inválido. Chave faltando: {e}")
+    except Exception as e:
+        print(f'Erro ao executar o benchmark: {e}')
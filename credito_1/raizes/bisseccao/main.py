@@ -1,10 +1,16 @@
 from dataclasses import dataclass
 from enum import Enum
 import os
-from sympy import sympify, symbols, N
+import sys
 import json
+import numpy as np
 from decimal import Decimal, getcontext
 
+sys.path.append(os.path.realpath(f'{os.path.dirname(os.path.realpath(__file__))}/../../..'))
+
+from common.bracketing import MAX_EVALUATIONS, BracketingException, BracketingState, get_bisection_iterations
+from common.expressions import solve_expression, solve_expression_array
+
 getcontext().prec = 50
 
 class StopConditionType(Enum):
@@ -31,11 +37,15 @@ class InputData:
     function: Function
     interval: Interval
     stop_condition: StopCondition
+    max_evaluations: int
+    scan_points: int | None
     
-    def __init__(self, function: Function, interval: Interval, stop_condition: StopCondition):
+    def __init__(self, function: Function, interval: Interval, stop_condition: StopCondition, max_evaluations: int = MAX_EVALUATIONS, scan_points: int | None = None):
         self.function = function
         self.interval = interval
         self.stop_condition = stop_condition
+        self.max_evaluations = max_evaluations
+        self.scan_points = scan_points
 
     def __str__(self):
         return f'f({self.function.variable}) = {self.function.expression}; [{self.interval.start}, {self.interval.end}]'
@@ -45,6 +55,15 @@ class Solution:
     interval: Interval
     value: Decimal
     error: Decimal
+    evaluations: int
+    iterations: int = 0
+
+@dataclass
+class ScanSolution:
+    intervals: list[Interval]
+    values: list[Decimal]
+    errors: list[Decimal]
+    iterations: int
 
 class SolutionException(Exception):
     def __init__(self, *args):
@@ -66,7 +85,9 @@ def get_data_from_json(file_path: str):
     return InputData(
         Function(data['function']['expression'], data['function']['variable']), 
         Interval(Decimal(str(data['interval']['start'])), Decimal(str(data['interval']['end']))),
-        stop_condition
+        stop_condition,
+        data['max_evaluations'] if 'max_evaluations' in data else MAX_EVALUATIONS,
+        data['scan']['points'] if 'scan' in data else None
     )
 
 def get_out_file(file_path: str):
@@ -76,29 +97,17 @@ def get_out_file(file_path: str):
     return file
 
 def solve_function(function: Function, variable_value: Decimal):
-    symp_expression = sympify(function.expression)
-    symp_variable = symbols(function.variable)
+    return solve_expression(function.expression, {function.variable: variable_value})
 
-    return Decimal(str(N(symp_expression.evalf(subs={symp_variable: variable_value}))))
-
-def solve_for_b(function: Function, interval: Interval, stop_condition: StopCondition, iteration: int):
-    if (interval.end - interval.start) < 0:
-        raise SolutionException('Intervalo Inválido')
-
-    solution_interval_end = solve_function(function, interval.end)
-    solution_interval_start = solve_function(function, interval.start)
+def solve_for_b(state: BracketingState, stop_condition: StopCondition, iteration: int):
+    interval = Interval(state.start, state.end)
+    solution_interval_start = state.value_at_start
+    solution_interval_end = state.value_at_end
 
     interval_middle = (interval.end + interval.start) / 2
-    solution_interval_middle = solve_function(function, interval_middle)
-
-    signal_change_for_start = (solution_interval_start * solution_interval_middle) < 0
-    signal_change_for_end = (solution_interval_end * solution_interval_middle) < 0
-
-    if not signal_change_for_start and not signal_change_for_end:
-        raise SolutionException('Não houve mudança de sinais, não é possível encontrar uma solução!')
-    
-    if signal_change_for_start: new_interval = Interval(interval.start, interval_middle)
-    if signal_change_for_end: new_interval = Interval(interval_middle, interval.end)
+    solution_interval_middle = state.evaluate(interval_middle)
+    state.update(interval_middle, solution_interval_middle)
+    new_interval = Interval(state.start, state.end)
 
     OUTPUT_FILE.write(f'{iteration};{interval.start:.15f};{interval.end:.15f};{solution_interval_start:.15f};{solution_interval_end:.15f};{interval_middle:.15f};{solution_interval_middle:.15f} \n'.replace('.', ','))
 
@@ -107,36 +116,128 @@ def solve_for_b(function: Function, interval: Interval, stop_condition: StopCond
     elif(stop_condition.type == StopConditionType.INTERVALSIZE):
         condition_value = new_interval.end - new_interval.start
 
-    return Solution(new_interval, interval_middle, condition_value)
+    return Solution(new_interval, interval_middle, condition_value, state.evaluations)
 
-def bissection_solve(function: Function, interval: Interval, stop_condition: StopCondition):
+def bissection_solve(function: Function, interval: Interval, stop_condition: StopCondition, max_evaluations: int = MAX_EVALUATIONS):
     OUTPUT_FILE.write('#;a;b;f(a);f(b);c = (b - a) / 2;f(c)\n')
     if((interval.end - interval.start) == 0):
-        return solve_function(function, interval.end)
-    
+        return Solution(interval, interval.end, abs(solve_function(function, interval.end)), 1)
+
+    state = BracketingState(lambda value: solve_function(function, value), interval.start, interval.end, max_evaluations)
+
+    if not state.has_signal_change():
+        raise SolutionException('Não houve mudança de sinais, não é possível encontrar uma solução!')
+    if state.value_at_start == 0:
+        return Solution(interval, interval.start, Decimal(0), state.evaluations)
+    if state.value_at_end == 0:
+        return Solution(interval, interval.end, Decimal(0), state.evaluations)
+
+    if(stop_condition.type == StopConditionType.INTERVALSIZE):
+        max_iterations = get_bisection_iterations(state.size(), stop_condition.value)
+        if max_iterations > 9999:
+            raise SolutionException("Não foi possível encontrar um resultado em 9999 iterações")
+    else:
+        max_iterations = 9999
+
     iteration = 1
-    solution: Solution = solve_for_b(function, interval, stop_condition, iteration)
+    solution: Solution = solve_for_b(state, stop_condition, iteration)
     
-    while((abs(solution.error) > stop_condition.value) and iteration <= 9999):
+    while((abs(solution.error) > stop_condition.value) and iteration < max_iterations):
         iteration += 1
-        solution = solve_for_b(function, solution.interval, stop_condition, iteration)
+        solution = solve_for_b(state, stop_condition, iteration)
     
-    if iteration > 9999:
-        raise SolutionException("Não foi possível encontrar um resultado em 9999 iterações")
+    if abs(solution.error) > stop_condition.value:
+        raise SolutionException(f"Não foi possível encontrar um resultado em {max_iterations} iterações")
     
-    return solution.value
+    solution.iterations = iteration
+    return solution
+
+def get_signal_change_brackets(function: Function, interval: Interval, points: int):
+    if points < 2:
+        raise SolutionException('A varredura precisa de pelo menos 2 pontos')
+
+    grid = np.linspace(float(interval.start), float(interval.end), points)
+    values = solve_expression_array(function.expression, {function.variable: grid})
+
+    changes = np.nonzero((values[:-1] * values[1:]) < 0)[0]
+    exact_roots = grid[values == 0]
+
+    return grid[changes], grid[changes + 1], values[changes], values[changes + 1], exact_roots
+
+def bissection_scan_solve(function: Function, interval: Interval, stop_condition: StopCondition, points: int):
+    OUTPUT_FILE.write('#;a;b;f(a);f(b);c = (b - a) / 2;f(c)\n')
+    if (interval.end - interval.start) <= 0:
+        raise SolutionException('Intervalo Inválido')
+
+    start, end, start_values, end_values, exact_roots = get_signal_change_brackets(function, interval, points)
+
+    if(stop_condition.type == StopConditionType.INTERVALSIZE):
+        max_iterations = get_bisection_iterations((interval.end - interval.start) / (points - 1), stop_condition.value)
+    else:
+        max_iterations = 9999
+
+    tolerance = float(stop_condition.value)
+    middle = (start + end) / 2
+    middle_values = np.zeros(len(middle))
+    active = np.ones(len(middle), dtype=bool)
+    iteration = 0
+
+    while active.any() and iteration < max_iterations:
+        iteration += 1
+        middle[active] = (start[active] + end[active]) / 2
+        middle_values[active] = solve_expression_array(function.expression, {function.variable: middle[active]})
+
+        for index in np.flatnonzero(active):
+            OUTPUT_FILE.write(f'{iteration};{start[index]:.15f};{end[index]:.15f};{start_values[index]:.15f};{end_values[index]:.15f};{middle[index]:.15f};{middle_values[index]:.15f} \n'.replace('.', ','))
+
+        left = active & ((start_values * middle_values) < 0)
+        right = active & ~left
+
+        end[left] = middle[left]
+        end_values[left] = middle_values[left]
+        start[right] = middle[right]
+        start_values[right] = middle_values[right]
+
+        if(stop_condition.type == StopConditionType.ERROR):
+            errors = np.abs(middle_values)
+        elif(stop_condition.type == StopConditionType.INTERVALSIZE):
+            errors = end - start
+
+        active &= (errors > tolerance) & (middle_values != 0)
+
+    if active.any():
+        raise SolutionException(f"Não foi possível encontrar um resultado para {np.count_nonzero(active)} raízes em {max_iterations} iterações")
+
+    zeros = np.zeros(len(exact_roots))
+    roots = np.concatenate((middle, exact_roots))
+    order = np.argsort(roots)
+    roots = roots[order]
+    root_values = np.concatenate((middle_values, zeros))[order]
+    start = np.concatenate((start, exact_roots))[order]
+    end = np.concatenate((end, exact_roots))[order]
+
+    return ScanSolution(
+        [Interval(Decimal(str(a)), Decimal(str(b))) for a, b in zip(start, end)],
+        [Decimal(str(root)) for root in roots],
+        [Decimal(str(abs(value))) for value in root_values],
+        iteration
+    )
 
 INPUT_PATH = 'input.json'
 OUTPUT_PATH = 'output.csv'
-OUTPUT_FILE = get_out_file(OUTPUT_PATH)
-
 if __name__ == '__main__':
-    
+    OUTPUT_FILE = get_out_file(OUTPUT_PATH)
+
     try:
         data = get_data_from_json(INPUT_PATH)
-        solution = bissection_solve(data.function, data.interval, data.stop_condition)
-        print(f"Solução encontrada e escrita no arquivo {OUTPUT_PATH}")
-    except SolutionException as ex:
+        if data.scan_points is not None:
+            solution = bissection_scan_solve(data.function, data.interval, data.stop_condition, data.scan_points)
+            print(f"{len(solution.values)} raízes encontradas e escritas no arquivo {OUTPUT_PATH}")
+        else:
+            solution = bissection_solve(data.function, data.interval, data.stop_condition, data.max_evaluations)
+            print(f"Solução encontrada e escrita no arquivo {OUTPUT_PATH}")
+            print(f"Avaliações da função: {solution.evaluations}")
+    except (SolutionException, BracketingException) as ex:
         print(ex)
     except KeyError as e:
         print(f"Formato de entrada inválido. Chave faltando: {e}")
@@ -0,0 +1,240 @@
+from dataclasses import dataclass
+from enum import Enum
+import os
+import sys
+import json
+from decimal import Decimal, getcontext
+
+sys.path.append(os.path.realpath(f'{os.path.dirname(os.path.realpath(__file__))}/../../..'))
+
+from common.bracketing import MAX_EVALUATIONS, BracketingException, BracketingState
+from common.expressions import solve_expression
+
+getcontext().prec = 50
+
+class StopConditionType(Enum):
+    ERROR = 1
+    INTERVALSIZE = 2
+
+class StepType(Enum):
+    BISECTION = 'bissecção'
+    SECANT = 'secante'
+    INVERSE_QUADRATIC = 'interpolação quadrática inversa'
+
+@dataclass
+class Function:
+    expression: str
+    variable: str
+
+@dataclass 
+class Interval:
+    start: Decimal
+    end: Decimal
+
+@dataclass 
+class StopCondition:
+    type: StopConditionType
+    value: Decimal
+
+@dataclass
+class InputData:
+    function: Function
+    interval: Interval
+    stop_condition: StopCondition
+    max_evaluations: int
+    
+    def __init__(self, function: Function, interval: Interval, stop_condition: StopCondition, max_evaluations: int = MAX_EVALUATIONS):
+        self.function = function
+        self.interval = interval
+        self.stop_condition = stop_condition
+        self.max_evaluations = max_evaluations
+
+    def __str__(self):
+        return f'f({self.function.variable}) = {self.function.expression}; [{self.interval.start}, {self.interval.end}]'
+
+@dataclass
+class BrentState:
+    previous: Decimal
+    previous_value: Decimal
+    point: Decimal
+    point_value: Decimal
+    contrapoint: Decimal
+    contrapoint_value: Decimal
+    step: Decimal
+    previous_step: Decimal
+
+@dataclass
+class Solution:
+    interval: Interval
+    value: Decimal
+    error: Decimal
+    evaluations: int
+    steps: dict[str, int]
+    iterations: int = 0
+
+class SolutionException(Exception):
+    def __init__(self, *args):
+        super().__init__(*args)
+
+def get_data_from_json(file_path: str):
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    
+    with open(f'{dir_path}/{file_path}', 'r') as json_file:
+        data = json.load(json_file)
+
+    if('error' in data['stop_condition']):
+        stop_condition = StopCondition(StopConditionType.ERROR, Decimal(str(data['stop_condition']['error'])))
+    elif('interval_size' in data['stop_condition']):
+        stop_condition = StopCondition(StopConditionType.INTERVALSIZE, Decimal(str(data['stop_condition']['interval_size'])))
+    else:
+        raise(KeyError('Forneça uma condição de parada no arquivo de entrada. Valores aceitos: "error" ou "interval_size"'))
+
+    return InputData(
+        Function(data['function']['expression'], data['function']['variable']), 
+        Interval(Decimal(str(data['interval']['start'])), Decimal(str(data['interval']['end']))),
+        stop_condition,
+        data['max_evaluations'] if 'max_evaluations' in data else MAX_EVALUATIONS
+    )
+
+def get_out_file(file_path: str):
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    file = open(f'{dir_path}/{file_path}', 'w')
+
+    return file
+
+def solve_function(function: Function, variable_value: Decimal):
+    return solve_expression(function.expression, {function.variable: variable_value})
+
+def get_tolerance(point: Decimal, stop_condition: StopCondition):
+    machine_epsilon = Decimal(10) ** (1 - getcontext().prec)
+    interval_tolerance = stop_condition.value if stop_condition.type == StopConditionType.INTERVALSIZE else Decimal(0)
+
+    return (2 * machine_epsilon * abs(point)) + (interval_tolerance / 2)
+
+def get_brent_step(brent: BrentState, middle: Decimal, tolerance: Decimal):
+    if abs(brent.previous_step) < tolerance or abs(brent.previous_value) <= abs(brent.point_value):
+        return StepType.BISECTION, middle, middle
+
+    s = brent.point_value / brent.previous_value
+
+    if brent.previous == brent.contrapoint:
+        step_type = StepType.SECANT
+        p = 2 * middle * s
+        q = 1 - s
+    else:
+        step_type = StepType.INVERSE_QUADRATIC
+        q = brent.previous_value / brent.contrapoint_value
+        r = brent.point_value / brent.contrapoint_value
+        p = s * ((2 * middle * q * (q - r)) - ((brent.point - brent.previous) * (r - 1)))
+        q = (q - 1) * (r - 1) * (s - 1)
+
+    if p > 0:
+        q = -q
+    p = abs(p)
+
+    if (2 * p) < min((3 * middle * q) - abs(tolerance * q), abs(brent.previous_step * q)):
+        return step_type, p / q, brent.step
+
+    return StepType.BISECTION, middle, middle
+
+def solve_for_brent(state: BracketingState, brent: BrentState, stop_condition: StopCondition, iteration: int, steps: dict[str, int]):
+    if (brent.point_value * brent.contrapoint_value) > 0:
+        brent.contrapoint = brent.previous
+        brent.contrapoint_value = brent.previous_value
+        brent.step = brent.point - brent.previous
+        brent.previous_step = brent.step
+
+    if abs(brent.contrapoint_value) < abs(brent.point_value):
+        brent.previous, brent.previous_value = brent.point, brent.point_value
+        brent.point, brent.point_value = brent.contrapoint, brent.contrapoint_value
+        brent.contrapoint, brent.contrapoint_value = brent.previous, brent.previous_value
+
+    tolerance = get_tolerance(brent.point, stop_condition)
+    middle = (brent.contrapoint - brent.point) / 2
+
+    step_type, step, previous_step = get_brent_step(brent, middle, tolerance)
+    steps[step_type.value] += 1
+    brent.step, brent.previous_step = step, previous_step
+
+    brent.previous = brent.point
+    brent.previous_value = brent.point_value
+
+    if abs(brent.step) > tolerance:
+        brent.point += brent.step
+    else:
+        brent.point += tolerance if middle > 0 else -tolerance
+
+    brent.point_value = state.evaluate(brent.point)
+
+    if (brent.point_value * brent.contrapoint_value) > 0:
+        new_interval = Interval(min(brent.previous, brent.point), max(brent.previous, brent.point))
+    else:
+        new_interval = Interval(min(brent.contrapoint, brent.point), max(brent.contrapoint, brent.point))
+
+    interval = Interval(min(brent.previous, brent.contrapoint), max(brent.previous, brent.contrapoint))
+    solution_interval_start = brent.previous_value if interval.start == brent.previous else brent.contrapoint_value
+    solution_interval_end = brent.contrapoint_value if interval.start == brent.previous else brent.previous_value
+
+    OUTPUT_FILE.write(f'{iteration};{interval.start:.15f};{interval.end:.15f};{solution_interval_start:.15f};{solution_interval_end:.15f};{brent.point:.15f};{brent.point_value:.15f} \n'.replace('.', ','))
+
+    if(stop_condition.type == StopConditionType.ERROR):
+        condition_value = abs(brent.point_value)
+    elif(stop_condition.type == StopConditionType.INTERVALSIZE):
+        condition_value = new_interval.end - new_interval.start
+
+    return Solution(new_interval, brent.point, condition_value, state.evaluations, steps)
+
+def brent_solve(function: Function, interval: Interval, stop_condition: StopCondition, max_evaluations: int = MAX_EVALUATIONS):
+    OUTPUT_FILE.write('#;a;b;f(a);f(b);c;f(c)\n')
+    if((interval.end - interval.start) == 0):
+        return Solution(interval, interval.end, abs(solve_function(function, interval.end)), 1, {})
+
+    state = BracketingState(lambda value: solve_function(function, value), interval.start, interval.end, max_evaluations)
+
+    if not state.has_signal_change():
+        raise SolutionException('Não houve mudança de sinais, não é possível encontrar uma solução!')
+    if state.value_at_start == 0:
+        return Solution(interval, interval.start, Decimal(0), state.evaluations, {})
+    if state.value_at_end == 0:
+        return Solution(interval, interval.end, Decimal(0), state.evaluations, {})
+
+    brent = BrentState(
+        state.start, state.value_at_start,
+        state.end, state.value_at_end,
+        state.start, state.value_at_start,
+        state.end - state.start, state.end - state.start
+    )
+    steps = {step_type.value: 0 for step_type in StepType}
+
+    iteration = 1
+    solution: Solution = solve_for_brent(state, brent, stop_condition, iteration, steps)
+
+    while((abs(solution.error) > stop_condition.value) and solution.error != 0 and iteration <= 9999):
+        iteration += 1
+        solution = solve_for_brent(state, brent, stop_condition, iteration, steps)
+
+    if iteration > 9999:
+        raise SolutionException("Não foi possível encontrar um resultado em 9999 iterações")
+
+    solution.iterations = iteration
+    return solution
+
+INPUT_PATH = 'input.json'
+OUTPUT_PATH = 'output.csv'
+if __name__ == '__main__':
+    OUTPUT_FILE = get_out_file(OUTPUT_PATH)
+
+    try:
+        data = get_data_from_json(INPUT_PATH)
+        solution = brent_solve(data.function, data.interval, data.stop_condition, data.max_evaluations)
+        print(f"Solução encontrada e escrita no arquivo {OUTPUT_PATH}")
+        print(f"Avaliações da função: {solution.evaluations}")
+        print(f"Passos: {', '.join([f'{name} = {count}' for name, count in solution.steps.items()])}")
+    except (SolutionException, BracketingException) as ex:
+        print(ex)
+    except KeyError as e:
+        print(f"Formato de entrada inválido. Chave faltando: {e}")
+    except Exception as e:
+        print(f'Erro ao solucionar o problema: {e}')
+    
+    OUTPUT_FILE.close()
@@ -0,0 +1,222 @@
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from enum import Enum
+import os
+import sys
+import json
+import numpy as np
+from decimal import Decimal, getcontext
+
+sys.path.append(os.path.realpath(f'{os.path.dirname(os.path.realpath(__file__))}/../../..'))
+
+from common.bracketing import MAX_EVALUATIONS, BracketingException, BracketingState, get_bisection_iterations
+from common.expressions import solve_expression
+
+getcontext().prec = 50
+
+WARM_START_FACTOR = 2
+MIN_WARM_START_WIDTH = 1000
+
+class StopConditionType(Enum):
+    ERROR = 1
+    INTERVALSIZE = 2
+
+@dataclass
+class Function:
+    expression: str
+    variable: str
+
+@dataclass
+class Parameter:
+    symbol: str
+    values: list[Decimal]
+
+@dataclass 
+class Interval:
+    start: Decimal
+    end: Decimal
+
+@dataclass 
+class StopCondition:
+    type: StopConditionType
+    value: Decimal
+
+@dataclass
+class InputData:
+    function: Function
+    parameter: Parameter
+    interval: Interval
+    stop_condition: StopCondition
+    workers: int
+
+    def __str__(self):
+        return f'f({self.function.variable}; {self.parameter.symbol}) = {self.function.expression}; [{self.interval.start}, {self.interval.end}]'
+
+@dataclass
+class Solution:
+    parameter: Decimal
+    value: Decimal | None
+    error: Decimal | None
+    evaluations: int
+
+class SolutionException(Exception):
+    def __init__(self, *args):
+        super().__init__(*args)
+
+def get_data_from_json(file_path: str):
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    
+    with open(f'{dir_path}/{file_path}', 'r') as json_file:
+        data = json.load(json_file)
+
+    if('error' in data['stop_condition']):
+        stop_condition = StopCondition(StopConditionType.ERROR, Decimal(str(data['stop_condition']['error'])))
+    elif('interval_size' in data['stop_condition']):
+        stop_condition = StopCondition(StopConditionType.INTERVALSIZE, Decimal(str(data['stop_condition']['interval_size'])))
+    else:
+        raise(KeyError('Forneça uma condição de parada no arquivo de entrada. Valores aceitos: "error" ou "interval_size"'))
+
+    parameter = data['parameter']
+    values = [Decimal(str(value)) for value in np.linspace(parameter['start'], parameter['end'], parameter['points'])]
+
+    return InputData(
+        Function(data['function']['expression'], data['function']['variable']),
+        Parameter(parameter['symbol'], values),
+        Interval(Decimal(str(data['interval']['start'])), Decimal(str(data['interval']['end']))),
+        stop_condition,
+        data['workers'] if 'workers' in data else os.cpu_count()
+    )
+
+def get_out_file(file_path: str):
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    file = open(f'{dir_path}/{file_path}', 'w')
+
+    return file
+
+def get_out_path(file_path: str):
+    return f'{os.path.dirname(os.path.realpath(__file__))}/{file_path}'
+
+def solve_function(function: Function, variable_value: Decimal, symbol: str, parameter_value: Decimal):
+    return solve_expression(function.expression, {function.variable: variable_value, symbol: parameter_value})
+
+def get_warm_start_bracket(interval: Interval, roots: list[Decimal], tolerance: Decimal, growth: int):
+    if len(roots) == 0:
+        return interval
+
+    if len(roots) == 1:
+        center, width = roots[-1], tolerance * MIN_WARM_START_WIDTH
+    else:
+        step = roots[-1] - roots[-2]
+        center, width = roots[-1] + step, max(abs(step) * WARM_START_FACTOR, tolerance * MIN_WARM_START_WIDTH)
+
+    width *= WARM_START_FACTOR ** growth
+
+    return Interval(max(interval.start, center - width), min(interval.end, center + width))
+
+def bissection_solve(state: BracketingState, stop_condition: StopCondition):
+    if(stop_condition.type == StopConditionType.INTERVALSIZE):
+        max_iterations = get_bisection_iterations(state.size(), stop_condition.value)
+    else:
+        max_iterations = 9999
+
+    for _ in range(max_iterations):
+        middle = (state.start + state.end) / 2
+        value = state.evaluate(middle)
+        state.update(middle, value)
+
+        if(stop_condition.type == StopConditionType.ERROR):
+            error = abs(value)
+        elif(stop_condition.type == StopConditionType.INTERVALSIZE):
+            error = state.size()
+
+        if error <= stop_condition.value:
+            return middle, error
+
+    raise BracketingException(f"Não foi possível encontrar um resultado em {max_iterations} iterações")
+
+def continuation_solve(function: Function, symbol: str, parameters: list[Decimal], interval: Interval, stop_condition: StopCondition):
+    solutions = []
+    roots = []
+
+    for parameter in parameters:
+        evaluations = 0
+        growth = 0
+
+        while True:
+            bracket = get_warm_start_bracket(interval, roots, stop_condition.value, growth)
+            state = BracketingState(lambda value: solve_function(function, value, symbol, parameter), bracket.start, bracket.end, MAX_EVALUATIONS - evaluations)
+
+            if state.has_signal_change() or bracket == interval:
+                break
+
+            evaluations += state.evaluations
+            growth += 1
+
+        try:
+            if not state.has_signal_change():
+                raise BracketingException('Não houve mudança de sinais, não é possível encontrar uma solução!')
+
+            if state.value_at_start == 0 or state.value_at_end == 0:
+                root, error = (state.start, Decimal(0)) if state.value_at_start == 0 else (state.end, Decimal(0))
+            else:
+                root, error = bissection_solve(state, stop_condition)
+        except BracketingException:
+            solutions.append(Solution(parameter, None, None, evaluations + state.evaluations))
+            roots = []
+            continue
+
+        roots.append(root)
+        solutions.append(Solution(parameter, root, error, evaluations + state.evaluations))
+
+    return solutions
+
+def sweep_solve(function: Function, parameter: Parameter, interval: Interval, stop_condition: StopCondition, workers: int):
+    if (interval.end - interval.start) <= 0:
+        raise SolutionException('Intervalo Inválido')
+
+    chunks = [list(chunk) for chunk in np.array_split(np.array(parameter.values, dtype=object), max(1, min(workers, len(parameter.values)))) if len(chunk) > 0]
+
+    with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+        futures = [executor.submit(continuation_solve, function, parameter.symbol, chunk, interval, stop_condition) for chunk in chunks]
+        solutions = [solution for future in futures for solution in future.result()]
+
+    return solutions
+
+def write_solutions(solutions: list[Solution], symbol: str, variable: str):
+    with get_out_file(OUTPUT_PATH) as output_file:
+        output_file.write(f'#;{symbol};{variable};erro;avaliações\n')
+
+        for index, solution in enumerate(solutions, start=1):
+            if solution.value is None:
+                output_file.write(f'{index};{solution.parameter:.15f};-;-;{solution.evaluations} \n'.replace('.', ','))
+            else:
+                output_file.write(f'{index};{solution.parameter:.15f};{solution.value:.15f};{solution.error:.15e};{solution.evaluations} \n'.replace('.', ','))
+
+    np.savez(
+        get_out_path(NPZ_OUTPUT_PATH),
+        parameters=np.array([float(solution.parameter) for solution in solutions]),
+        roots=np.array([float(solution.value) if solution.value is not None else np.nan for solution in solutions]),
+        errors=np.array([float(solution.error) if solution.error is not None else np.nan for solution in solutions]),
+        evaluations=np.array([solution.evaluations for solution in solutions])
+    )
+
+INPUT_PATH = 'input.json'
+OUTPUT_PATH = 'output.csv'
+NPZ_OUTPUT_PATH = 'output.npz'
+
+if __name__ == '__main__':
+    
+    try:
+        data = get_data_from_json(INPUT_PATH)
+        solutions = sweep_solve(data.function, data.parameter, data.interval, data.stop_condition, data.workers)
+        write_solutions(solutions, data.parameter.symbol, data.function.variable)
+
+        solved = [solution for solution in solutions if solution.value is not None]
+        print(f"{len(solved)} de {len(solutions)} valores de {data.parameter.symbol} solucionados e escritos nos arquivos {OUTPUT_PATH} e {NPZ_OUTPUT_PATH}")
+        print(f"Avaliações da função: {sum([solution.evaluations for solution in solutions])}")
+    except (SolutionException, BracketingException) as ex:
+        print(ex)
+    except KeyError as e:
+        print(f"Formato de entrada inválido. Chave faltando: {e}")
+    except Exception as e:
+        print(f'Erro ao solucionar o problema: {e}')
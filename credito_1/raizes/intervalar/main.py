@@ -0,0 +1,239 @@
+from dataclasses import dataclass
+from enum import Enum
+import os
+import sys
+import json
+import mpmath
+from mpmath import iv
+from decimal import ROUND_CEILING, ROUND_FLOOR, Decimal, getcontext, localcontext
+
+sys.path.append(os.path.realpath(f'{os.path.dirname(os.path.realpath(__file__))}/../../..'))
+
+from common.expressions import differentiate_expression, solve_expression_interval, to_interval
+
+getcontext().prec = 50
+iv.dps = getcontext().prec
+
+MAX_ITERATIONS = 9999
+MIN_CONTRACTION = Decimal('0.5')
+
+class MethodType(Enum):
+    NEWTON = 1
+    KRAWCZYK = 2
+
+class RootType(Enum):
+    UNIQUE = 'raiz única'
+    POSSIBLE = 'possível raiz'
+
+@dataclass
+class Function:
+    expression: str
+    differential: str
+    variable: str
+
+@dataclass 
+class Interval:
+    start: Decimal
+    end: Decimal
+
+@dataclass
+class InputData:
+    function: Function
+    interval: Interval
+    tolerance: Decimal
+    method: MethodType
+
+    def __str__(self):
+        return f'f({self.function.variable}) = {self.function.expression}; [{self.interval.start}, {self.interval.end}]'
+
+@dataclass
+class Root:
+    interval: Interval
+    type: RootType
+
+@dataclass
+class Solution:
+    roots: list[Root]
+    pruned: int
+    iterations: int
+
+class SolutionException(Exception):
+    def __init__(self, *args):
+        super().__init__(*args)
+
+def get_data_from_json(file_path: str):
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    
+    with open(f'{dir_path}/{file_path}', 'r') as json_file:
+        data = json.load(json_file)
+
+    if 'interval_size' not in data['stop_condition']:
+        raise(KeyError('Forneça a condição de parada "interval_size" no arquivo de entrada'))
+
+    expression = data['function']['expression']
+    variable = data['function']['variable']
+
+    return InputData(
+        Function(expression, differentiate_expression(expression, variable), variable),
+        Interval(Decimal(str(data['interval']['start'])), Decimal(str(data['interval']['end']))),
+        Decimal(str(data['stop_condition']['interval_size'])),
+        MethodType[data['method'].upper()] if 'method' in data else MethodType.KRAWCZYK
+    )
+
+def get_out_file(file_path: str):
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    file = open(f'{dir_path}/{file_path}', 'w')
+
+    return file
+
+def solve_function(function: Function, interval: iv.mpf):
+    return solve_expression_interval(function.expression, {function.variable: interval})
+
+def solve_differential(function: Function, interval: iv.mpf):
+    return solve_expression_interval(function.differential, {function.variable: interval})
+
+def to_decimal(value: iv.mpf, rounding: str):
+    number = mpmath.mpf(value)
+    mantissa, exponent = number.man_exp
+
+    if number < 0:
+        with localcontext() as context:
+            context.rounding = ROUND_FLOOR if rounding == ROUND_CEILING else ROUND_CEILING
+            return -(Decimal(mantissa) * (Decimal(2) ** exponent))
+
+    with localcontext() as context:
+        context.rounding = rounding
+        return Decimal(mantissa) * (Decimal(2) ** exponent)
+
+def to_decimal_interval(interval: iv.mpf):
+    return Interval(to_decimal(interval.a, ROUND_FLOOR), to_decimal(interval.b, ROUND_CEILING))
+
+def intersect(first: iv.mpf, second: iv.mpf):
+    start = max(first.a, second.a)
+    end = min(first.b, second.b)
+
+    if start > end:
+        return None
+
+    return iv.mpf([start, end])
+
+def is_interior(inner: iv.mpf, outer: iv.mpf):
+    return outer.a < inner.a and inner.b < outer.b
+
+def bisect(interval: iv.mpf):
+    middle = interval.mid.a
+
+    return [iv.mpf([interval.a, middle]), iv.mpf([middle, interval.b])]
+
+def get_newton_operator(function: Function, interval: iv.mpf):
+    middle = iv.mpf(interval.mid.a)
+    differential = solve_differential(function, interval)
+
+    if 0 in differential:
+        return None
+
+    return middle - (solve_function(function, middle) / differential)
+
+def get_krawczyk_operator(function: Function, interval: iv.mpf):
+    middle = iv.mpf(interval.mid.a)
+    differential_at_middle = solve_differential(function, middle).mid
+
+    if differential_at_middle == 0:
+        return None
+
+    preconditioner = 1 / iv.mpf(differential_at_middle)
+    differential = solve_differential(function, interval)
+
+    return middle - (preconditioner * solve_function(function, middle)) + ((1 - (preconditioner * differential)) * (interval - middle))
+
+def get_operator(function: Function, interval: iv.mpf, method: MethodType):
+    if method == MethodType.NEWTON:
+        return get_newton_operator(function, interval)
+
+    return get_krawczyk_operator(function, interval)
+
+def get_width(interval: iv.mpf):
+    return to_decimal(interval.delta.b, ROUND_CEILING)
+
+def interval_solve(function: Function, interval: Interval, tolerance: Decimal, method: MethodType):
+    OUTPUT_FILE.write('#;a;b;f([a, b]);operador;resultado\n')
+    if (interval.end - interval.start) < 0:
+        raise SolutionException('Intervalo Inválido')
+
+    pending = [to_interval(interval.start, interval.end)]
+    roots = []
+    pruned = 0
+    iteration = 0
+
+    while len(pending) > 0:
+        iteration += 1
+        if iteration > MAX_ITERATIONS:
+            raise SolutionException(f"Não foi possível isolar as raízes em {MAX_ITERATIONS} iterações")
+
+        current = pending.pop()
+        value = solve_function(function, current)
+
+        if 0 not in value:
+            pruned += 1
+            OUTPUT_FILE.write(f'{iteration};{to_decimal(current.a, ROUND_FLOOR):.15f};{to_decimal(current.b, ROUND_CEILING):.15f};{value};-;descartado \n'.replace('.', ','))
+            continue
+
+        operator = get_operator(function, current, method)
+        contracted = intersect(current, operator) if operator is not None else current
+
+        if contracted is None:
+            pruned += 1
+            result = 'descartado'
+        elif operator is not None and is_interior(operator, current):
+            if get_width(contracted) <= tolerance:
+                roots.append(Root(to_decimal_interval(contracted), RootType.UNIQUE))
+                result = RootType.UNIQUE.value
+            else:
+                pending.append(contracted)
+                result = 'contraído'
+        elif get_width(current) <= tolerance:
+            roots.append(Root(to_decimal_interval(current), RootType.POSSIBLE))
+            result = RootType.POSSIBLE.value
+        elif get_width(contracted) <= MIN_CONTRACTION * get_width(current):
+            pending.append(contracted)
+            result = 'contraído'
+        else:
+            pending.extend(reversed(bisect(contracted)))
+            result = 'subdividido'
+
+        OUTPUT_FILE.write(f'{iteration};{to_decimal(current.a, ROUND_FLOOR):.15f};{to_decimal(current.b, ROUND_CEILING):.15f};{value};{operator if operator is not None else "-"};{result} \n'.replace('.', ','))
+
+    return Solution(merge_roots(roots), pruned, iteration)
+
+def merge_roots(roots: list[Root]):
+    merged = []
+
+    for root in sorted(roots, key=lambda root: root.interval.start):
+        if len(merged) > 0 and merged[-1].type == root.type and merged[-1].interval.end >= root.interval.start:
+            merged[-1].interval.end = max(merged[-1].interval.end, root.interval.end)
+        else:
+            merged.append(root)
+
+    return merged
+
+INPUT_PATH = 'input.json'
+OUTPUT_PATH = 'output.csv'
+OUTPUT_FILE = get_out_file(OUTPUT_PATH)
+
+if __name__ == '__main__':
+    
+    try:
+        data = get_data_from_json(INPUT_PATH)
+        solution = interval_solve(data.function, data.interval, data.tolerance, data.method)
+        print(f"Processo escrito no arquivo {OUTPUT_PATH}")
+        print(f"Subintervalos descartados sem raiz: {solution.pruned}")
+        for root in solution.roots:
+            print(f"{root.type.value}: [{root.interval.start:.15f}, {root.interval.end:.15f}]")
+    except SolutionException as ex:
+        print(ex)
+    except KeyError as e:
+        print(f"Formato de entrada inválido. Chave faltando: {e}")
+    except Exception as e:
+        print(f'Erro ao solucionar o problema: {e}')
+    
+    OUTPUT_FILE.close()
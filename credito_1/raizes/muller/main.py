@@ -0,0 +1,157 @@
+from dataclasses import dataclass
+from enum import Enum
+import os
+import sys
+import json
+import mpmath
+from decimal import Decimal, getcontext
+
+sys.path.append(os.path.realpath(f'{os.path.dirname(os.path.realpath(__file__))}/../../..'))
+
+from common.expressions import solve_expression_complex
+
+getcontext().prec = 50
+
+REAL_TOLERANCE = mpmath.mpf('1e-25')
+
+class StopConditionType(Enum):
+    ERROR = 1
+    INTERVALSIZE = 2
+
+@dataclass
+class Function:
+    expression: str
+    variable: str
+
+@dataclass 
+class StopCondition:
+    type: StopConditionType
+    value: Decimal
+
+@dataclass
+class InputData:
+    function: Function
+    x0: Decimal
+    x1: Decimal
+    x2: Decimal
+    stop_condition: StopCondition
+
+    def __init__(self, function: Function, x0: Decimal, x1: Decimal, stop_condition: StopCondition, x2: Decimal | None = None):
+        self.function = function
+        self.x0 = x0
+        self.x1 = x1
+        self.x2 = x2 if x2 is not None else (x0 + x1) / 2
+        self.stop_condition = stop_condition
+
+    def __str__(self):
+        return f'f({self.function.variable}) = {self.function.expression}; {self.function.variable} = {self.x0}, {self.x1}, {self.x2}'
+
+@dataclass
+class Solution:
+    value: mpmath.mpc
+    next_point: mpmath.mpc
+    error: Decimal
+    iterations: int = 0
+
+    def is_real(self):
+        return abs(self.next_point.imag) <= REAL_TOLERANCE * max(abs(self.next_point), 1)
+
+class SolutionException(Exception):
+    def __init__(self, *args):
+        super().__init__(*args)
+
+def get_data_from_json(file_path: str):
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    
+    with open(f'{dir_path}/{file_path}', 'r') as json_file:
+        data = json.load(json_file)
+
+    stop_condition = StopCondition(StopConditionType.ERROR, Decimal(str(data['stop_condition']['error'])))
+
+    return InputData(
+        Function(data['function']['expression'], data['function']['variable']),
+        Decimal(str(data['x0'])),
+        Decimal(str(data['x1'])),
+        stop_condition,
+        Decimal(str(data['x2'])) if 'x2' in data else None
+    )
+
+def get_out_file(file_path: str):
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    file = open(f'{dir_path}/{file_path}', 'w')
+
+    return file
+
+def solve_function(function: Function, variable_value: mpmath.mpc):
+    return solve_expression_complex(function.expression, {function.variable: variable_value})
+
+def format_complex(value: mpmath.mpc):
+    return f'{Decimal(str(value.real)):.15f}{Decimal(str(value.imag)):+.15f}i'
+
+def solve_for_muller(function: Function, points: list[mpmath.mpc], values: list[mpmath.mpc], iteration: int):
+    with mpmath.workdps(getcontext().prec):
+        first_step = points[1] - points[0]
+        second_step = points[2] - points[1]
+
+        if first_step == 0 or second_step == 0 or (first_step + second_step) == 0:
+            raise SolutionException("Os pontos x[k-2], x[k-1] e x[k] precisam ser distintos")
+
+        first_slope = (values[1] - values[0]) / first_step
+        second_slope = (values[2] - values[1]) / second_step
+        a = (second_slope - first_slope) / (second_step + first_step)
+        b = (a * second_step) + second_slope
+        c = values[2]
+
+        discriminant = mpmath.sqrt((b ** 2) - (4 * a * c))
+        denominator = b + discriminant if abs(b + discriminant) >= abs(b - discriminant) else b - discriminant
+
+        if denominator == 0:
+            raise SolutionException("Não é possível dividir por 0")
+
+        next_point = points[2] - ((2 * c) / denominator)
+        error = Decimal(str(abs(next_point - points[2])))
+
+    OUTPUT_FILE.write(f'{iteration};{format_complex(points[2])};{format_complex(values[2])};{format_complex(next_point)};{error:.15f} \n'.replace('.', ','))
+
+    return Solution(values[2], next_point, error)
+
+def muller_solve(function: Function, x0: Decimal, x1: Decimal, x2: Decimal, stop_condition: StopCondition):
+    OUTPUT_FILE.write('#;x[k];f(x[k]);x[k+1];|x[k+1] - x[k]| \n')
+
+    points = [mpmath.mpc(str(x0)), mpmath.mpc(str(x1)), mpmath.mpc(str(x2))]
+    values = [solve_function(function, point) for point in points]
+
+    for iteration in range(1, 10000):
+        solution: Solution = solve_for_muller(function, points, values, iteration)
+        points = [*points[1:], solution.next_point]
+        values = [*values[1:], solve_function(function, solution.next_point)]
+
+        if values[-1] == 0:
+            return Solution(values[-1], points[-1], Decimal(0), iteration)
+
+        if abs(solution.error) <= stop_condition.value and Decimal(str(abs(values[-1]))) <= stop_condition.value:
+            return Solution(values[-1], points[-1], solution.error, iteration)
+
+    raise SolutionException("Não foi possível encontrar um resultado em 9999 iterações")
+
+INPUT_PATH = 'input.json'
+OUTPUT_PATH = 'output.csv'
+if __name__ == '__main__':
+    OUTPUT_FILE = get_out_file(OUTPUT_PATH)
+
+    try:
+        data = get_data_from_json(INPUT_PATH)
+        solution = muller_solve(data.function, data.x0, data.x1, data.x2, data.stop_condition)
+        print(f"Solução encontrada e escrita no arquivo {OUTPUT_PATH}")
+        if solution.is_real():
+            print(f"{data.function.variable} = {solution.next_point.real}")
+        else:
+            print(f"{data.function.variable} = {format_complex(solution.next_point)} (raiz complexa)")
+    except SolutionException as ex:
+        print(ex)
+    except KeyError as e:
+        print(f"Formato de entrada inválido. Chave faltando: {e}")
+    except Exception as e:
+        print(f'Erro ao solucionar o problema: {e}')
+    
+    OUTPUT_FILE.close()
@@ -1,21 +1,42 @@
 from dataclasses import dataclass
 from enum import Enum
 import os
+import sys
 import traceback
-from sympy import sympify, symbols, N
 import json
+import math
+import time
+import mpmath
+import numpy as np
 from decimal import Decimal, getcontext
 
+sys.path.append(os.path.realpath(f'{os.path.dirname(os.path.realpath(__file__))}/../../..'))
+
+from common.convergence import get_convergence_order
+from common.expressions import compile_expressions, differentiate_expression, solve_expression, solve_expression_complex, solve_expressions, solve_expressions_array
+
 getcontext().prec = 50
 
+DIFFERENTIAL_TOLERANCE = Decimal('1e-4')
+DIFFERENTIAL_NEIGHBORHOOD = Decimal('0.1')
+RATIO_STABILITY_TOLERANCE = Decimal('0.01')
+MULTIPLICITY_ROUNDING_TOLERANCE = Decimal('0.25')
+FLOAT_TOLERANCE = 4 * np.finfo(float).eps
+MAX_POLISH_ITERATIONS = 100
+
 class StopConditionType(Enum):
     ERROR = 1
     INTERVALSIZE = 2
 
+class MethodType(Enum):
+    NEWTON = 1
+    HALLEY = 2
+    HOUSEHOLDER = 3
+
 @dataclass
 class Function:
     expression: str
-    differential: str
+    differential: str | None
     variable: str
 
 @dataclass 
@@ -23,16 +44,36 @@ class StopCondition:
     type: StopConditionType
     value: Decimal
 
+@dataclass
+class ComplexGrid:
+    real: np.ndarray
+    imaginary: np.ndarray
+    basins: bool
+
 @dataclass
 class InputData:
     function: Function
-    starting_point: Decimal
+    starting_point: Decimal | None
     stop_condition: StopCondition
+    starting_points: list[Decimal] | None
+    order: int
+    multiplicity: int
+    detect_multiplicity: bool
+    mixed_precision: bool
+    deflation_roots: int | None
+    complex_grid: ComplexGrid | None
     
-    def __init__(self, function: Function, starting_point: Decimal, stop_condition: StopCondition):
+    def __init__(self, function: Function, starting_point: Decimal | None, stop_condition: StopCondition, starting_points: list[Decimal] | None = None, order: int = 1, multiplicity: int = 1, detect_multiplicity: bool = False, mixed_precision: bool = False, deflation_roots: int | None = None, complex_grid: ComplexGrid | None = None):
         self.function = function
         self.starting_point = starting_point
         self.stop_condition = stop_condition
+        self.starting_points = starting_points
+        self.order = order
+        self.multiplicity = multiplicity
+        self.detect_multiplicity = detect_multiplicity
+        self.mixed_precision = mixed_precision
+        self.deflation_roots = deflation_roots
+        self.complex_grid = complex_grid
 
     def __str__(self):
         return f'f({self.function.variable}) = {self.function.expression}; {self.function.variable} = {self.starting_point}'
@@ -42,6 +83,36 @@ class Solution:
     point: Decimal
     next_point: Decimal
     error: Decimal
+    order: Decimal | None = None
+    multiplicity: int = 1
+    iterations: int = 0
+
+@dataclass
+class MixedPrecisionSolution:
+    solution: Solution
+    float_iterations: int
+    precise_iterations: int
+    float_time: float
+    precise_time: float
+
+@dataclass
+class DeflationSolution:
+    roots: list[Decimal]
+    deflated_roots: list[Decimal]
+
+@dataclass
+class ComplexSolution:
+    roots: list[mpmath.mpc]
+    basins: np.ndarray
+    iterations: np.ndarray
+
+@dataclass
+class BatchSolution:
+    starting_points: np.ndarray
+    points: np.ndarray
+    roots: list[Decimal]
+    root_indexes: np.ndarray
+    iterations: np.ndarray
 
 class SolutionException(Exception):
     def __init__(self, *args):
@@ -55,10 +126,46 @@ def get_data_from_json(file_path: str):
 
     stop_condition = StopCondition(StopConditionType.ERROR, Decimal(str(data['stop_condition']['error'])))
 
+    if 'starting_points' in data:
+        starting_points = [Decimal(str(value)) for value in data['starting_points']]
+    elif 'starting_grid' in data:
+        grid = data['starting_grid']
+        starting_points = [Decimal(str(value)) for value in np.linspace(grid['start'], grid['end'], grid['points'])]
+    else:
+        starting_points = None
+
+    if 'complex_grid' in data:
+        grid = data['complex_grid']
+        complex_grid = ComplexGrid(
+            np.linspace(grid['real']['start'], grid['real']['end'], grid['real']['points']),
+            np.linspace(grid['imaginary']['start'], grid['imaginary']['end'], grid['imaginary']['points']),
+            grid['basins'] if 'basins' in grid else False
+        )
+    else:
+        complex_grid = None
+
+    method = MethodType[data['method'].upper()] if 'method' in data else MethodType.NEWTON
+    if method == MethodType.HOUSEHOLDER:
+        if 'order' not in data:
+            raise KeyError('Informe a ordem "order" do método de Householder')
+        order = int(data['order'])
+    else:
+        order = method.value
+
+    detect_multiplicity = 'multiplicity' in data and data['multiplicity'] == 'auto'
+    multiplicity = int(data['multiplicity']) if 'multiplicity' in data and not detect_multiplicity else 1
+
     return InputData(
-        Function(data['function']['expression'], data['function']['differential'], data['function']['variable']),
-        Decimal(data['starting_point']),
-        stop_condition
+        Function(data['function']['expression'], data['function']['differential'] if 'differential' in data['function'] else None, data['function']['variable']),
+        Decimal(data['starting_point']) if starting_points is None and complex_grid is None else None,
+        stop_condition,
+        starting_points,
+        order,
+        multiplicity,
+        detect_multiplicity,
+        data['mixed_precision'] if 'mixed_precision' in data else False,
+        int(data['deflation']) if 'deflation' in data else None,
+        complex_grid
     )
 
 def get_out_file(file_path: str):
@@ -68,55 +175,387 @@ def get_out_file(file_path: str):
     return file
 
 def solve_function(function: Function, variable_value: Decimal):
-    symp_expression = sympify(function.expression)
-    symp_variable = symbols(function.variable)
-    
-    return Decimal(str(N(symp_expression.evalf(subs={symp_variable: variable_value}))))
+    return solve_expression(function.expression, {function.variable: variable_value})
 
 def solve_differential(function: Function, variable_value: Decimal):
-    symp_expression = sympify(function.differential)
-    symp_variable = symbols(function.variable)
-    
-    return Decimal(str(N(symp_expression.evalf(subs={symp_variable: variable_value}))))
+    return solve_expression(function.differential, {function.variable: variable_value})
+
+def solve_function_and_differential(function: Function, variable_value: Decimal):
+    return solve_expressions((function.expression, function.differential), {function.variable: variable_value})
+
+def check_differential(function: Function, points: list[Decimal]):
+    symbolic_differential = Function(function.expression, differentiate_expression(function.expression, function.variable), function.variable)
+
+    for point in points:
+        try:
+            given = solve_differential(function, point)
+            expected = solve_differential(symbolic_differential, point)
+        except (ArithmeticError, ValueError):
+            continue
+
+        if not (given.is_finite() and expected.is_finite()):
+            continue
+
+        if abs(given - expected) > DIFFERENTIAL_TOLERANCE * max(abs(expected), Decimal(1)):
+            return f'f\'({function.variable}) = {function.differential} difere da derivada simbólica {symbolic_differential.differential} em {function.variable} = {point}: {given:.15f} != {expected:.15f}'
+
+    return None
+
+def prepare_differential(function: Function, starting_point: Decimal):
+    if function.differential is None:
+        return Function(function.expression, differentiate_expression(function.expression, function.variable), function.variable)
 
-def solve_for_nr(function: Function, value: Decimal, iteration: int):
-    solution_for_function = solve_function(function, value)
-    solution_for_differential = solve_differential(function, value)
+    step = DIFFERENTIAL_NEIGHBORHOOD * max(abs(starting_point), Decimal(1))
+    mismatch = check_differential(function, [starting_point - step, starting_point, starting_point + step])
+    if mismatch is not None:
+        print(f'Aviso: {mismatch}')
 
-    if solution_for_differential == 0:
+    return function
+
+def get_derivatives(function: Function, order: int):
+    higher_derivatives = [differentiate_expression(function.expression, function.variable, k) for k in range(2, order + 1)]
+
+    return (function.expression, function.differential, *higher_derivatives)
+
+def get_householder_step(derivative_values: list[Decimal]):
+    coefficients = [value / math.factorial(k) for k, value in enumerate(derivative_values)]
+    inverse_coefficients = [1 / coefficients[0]]
+
+    for k in range(1, len(coefficients)):
+        inverse_coefficients.append(-sum([coefficients[j] * inverse_coefficients[k - j] for j in range(1, k + 1)]) / coefficients[0])
+
+    if inverse_coefficients[-1] == 0:
         raise SolutionException("Não é possível dividir por 0")
 
-    next_value = Decimal(value - (solution_for_function / solution_for_differential))
+    return inverse_coefficients[-2] / inverse_coefficients[-1]
+
+def estimate_multiplicity(errors: list[Decimal]):
+    if len(errors) < 4 or 0 in errors[-4:]:
+        return None
+
+    ratios = [errors[k] / errors[k - 1] for k in range(-3, 0)]
+
+    if max(ratios) - min(ratios) > RATIO_STABILITY_TOLERANCE or not (0 < ratios[-1] < 1):
+        return None
+
+    return get_rounded_multiplicity(1 / (1 - ratios[-1]))
+
+def estimate_multiplicity_from_u(function: Function, value: Decimal):
+    solution_for_function, solution_for_differential, solution_for_second_differential = solve_expressions(get_derivatives(function, 2), {function.variable: value})
+    denominator = (solution_for_differential ** 2) - (solution_for_function * solution_for_second_differential)
+
+    if denominator == 0:
+        return None
+
+    return get_rounded_multiplicity((solution_for_differential ** 2) / denominator)
+
+def get_rounded_multiplicity(estimate: Decimal):
+    multiplicity = int(estimate.to_integral_value())
+
+    if multiplicity < 2 or abs(estimate - multiplicity) > MULTIPLICITY_ROUNDING_TOLERANCE:
+        return None
 
-    OUTPUT_FILE.write(f'{iteration};{value:.15f};{solution_for_function:.15f};{solution_for_differential:.15f};{next_value:.15f};{abs(next_value - value):.15f} \n'.replace('.', ','))
+    return multiplicity
 
-    return Solution(value, next_value, Decimal(abs(next_value - value)))
+def solve_for_nr(function: Function, value: Decimal, iteration: int, errors: list[Decimal], order: int = 1, multiplicity: int = 1):
+    derivative_values = solve_expressions(get_derivatives(function, order), {function.variable: value})
+    solution_for_function, solution_for_differential = derivative_values[0], derivative_values[1]
 
-def newton_raphson_solve(function: Function, starting_point: Decimal, stop_condition: StopCondition):
-    OUTPUT_FILE.write('#;x;f(x);f\'(x);x[k+1] = x - (f(x) / f\'(x));x[k+1] - x[k] \n')
+    if order == 1 and solution_for_differential == 0:
+        raise SolutionException("Não é possível dividir por 0")
+
+    if solution_for_function == 0:
+        next_value = value
+    elif order == 1:
+        next_value = Decimal(value - (multiplicity * solution_for_function / solution_for_differential))
+    else:
+        next_value = value + get_householder_step(derivative_values)
+
+    error = Decimal(abs(next_value - value))
+    convergence_order = get_convergence_order([*errors, error])
+
+    OUTPUT_FILE.write(f'{iteration};{value:.15f};{solution_for_function:.15f};{solution_for_differential:.15f};{next_value:.15f};{error:.15f};{f"{convergence_order:.6f}" if convergence_order is not None else "-"};{multiplicity} \n'.replace('.', ','))
+
+    return Solution(value, next_value, error, convergence_order, multiplicity)
+
+def newton_raphson_solve(function: Function, starting_point: Decimal, stop_condition: StopCondition, order: int = 1, multiplicity: int = 1, detect_multiplicity: bool = False):
+    next_value_header = 'x[k+1] = x - m * (f(x) / f\'(x))' if order == 1 else 'x[k+1]'
+    if order > 1 and (multiplicity != 1 or detect_multiplicity):
+        raise SolutionException("A multiplicidade só é suportada pelo método de Newton; os métodos de Halley e Householder não a aplicam")
+
+    OUTPUT_FILE.write(f'#;x;f(x);f\'(x);{next_value_header};x[k+1] - x[k];ordem observada;m \n')
+    function = prepare_differential(function, starting_point)
     
     iteration = 1
-    solution: Solution = solve_for_nr(function, starting_point, iteration)
+    solution: Solution = solve_for_nr(function, starting_point, iteration, [], order, multiplicity)
+    errors = [solution.error]
     
     while((abs(solution.error) > stop_condition.value) and iteration <= 9999):
         iteration += 1
-        solution = solve_for_nr(function, solution.next_point, iteration)
+        solution = solve_for_nr(function, solution.next_point, iteration, errors, order, multiplicity)
+        errors.append(solution.error)
+
+        if detect_multiplicity and order == 1:
+            detected_multiplicity = estimate_multiplicity(errors)
+            if detected_multiplicity is not None and detected_multiplicity == estimate_multiplicity_from_u(function, solution.next_point):
+                multiplicity = detected_multiplicity
+                detect_multiplicity = False
+                errors = [solution.error]
     
     if iteration > 9999:
         raise SolutionException("Não foi possível encontrar um resultado em 9999 iterações")
     
-    return solution.point
+    solution.iterations = iteration
+    return solution
+
+def newton_raphson_mixed_solve(function: Function, starting_point: Decimal, stop_condition: StopCondition):
+    OUTPUT_FILE.write('#;fase;x;f(x);f\'(x);x[k+1];x[k+1] - x[k] \n')
+    function = prepare_differential(function, starting_point)
+    tolerance = float(stop_condition.value)
+    expressions = (function.expression, function.differential)
+    compile_expressions(expressions, (function.variable,), 'numpy')
+    compile_expressions(expressions, (function.variable,))
+
+    float_start = time.perf_counter()
+    point = np.array([float(starting_point)])
+    float_iteration = 0
+    while float_iteration < 9999:
+        value, differential = solve_expressions_array(expressions, {function.variable: point})
+        with np.errstate(all='ignore'):
+            step = value / differential
+        next_point = point - step
+
+        if not np.isfinite(next_point).all():
+            break
+
+        float_iteration += 1
+        OUTPUT_FILE.write(f'{float_iteration};float64;{point[0]:.15f};{value[0]:.15f};{differential[0]:.15f};{next_point[0]:.15f};{abs(step[0]):.15f} \n'.replace('.', ','))
+        point = next_point
+
+        if abs(step[0]) <= max(tolerance, FLOAT_TOLERANCE * abs(point[0])):
+            break
+    float_time = time.perf_counter() - float_start
+
+    precise_start = time.perf_counter()
+    value = Decimal(str(point[0]))
+    precise_iteration = 0
+    solution = None
+    while float_iteration + precise_iteration < 9999:
+        precise_iteration += 1
+        solution_for_function, solution_for_differential = solve_function_and_differential(function, value)
+
+        if solution_for_differential == 0:
+            raise SolutionException("Não é possível dividir por 0")
+
+        next_value = value - (solution_for_function / solution_for_differential)
+        error = abs(next_value - value)
+        OUTPUT_FILE.write(f'{float_iteration + precise_iteration};decimal;{value:.15f};{solution_for_function:.15f};{solution_for_differential:.15f};{next_value:.15f};{error:.15e} \n'.replace('.', ','))
+
+        solution = Solution(value, next_value, error)
+        value = next_value
+
+        if error <= stop_condition.value:
+            break
+    precise_time = time.perf_counter() - precise_start
+
+    if solution is None or solution.error > stop_condition.value:
+        raise SolutionException("Não foi possível encontrar um resultado em 9999 iterações")
+
+    return MixedPrecisionSolution(solution, float_iteration, precise_iteration, float_time, precise_time)
+
+def get_deflated_function(function: Function, roots: list[Decimal]):
+    if len(roots) == 0:
+        return function
+
+    denominator = ' * '.join([f'({function.variable} - ({root}))' for root in roots])
+
+    return Function(f'({function.expression}) / ({denominator})', None, function.variable)
+
+def newton_raphson_deflation_solve(function: Function, starting_point: Decimal, stop_condition: StopCondition, roots_count: int):
+    if roots_count < 1:
+        raise SolutionException('Informe pelo menos 1 raiz em "deflation"')
+
+    roots = []
+    deflated_roots = []
+    duplicate_tolerance = max(stop_condition.value * 10, Decimal('1e-30'))
+
+    for index in range(1, roots_count + 1):
+        OUTPUT_FILE.write(f'raiz {index};deflação \n')
+        deflated_root = newton_raphson_solve(get_deflated_function(function, deflated_roots), starting_point, stop_condition).next_point
+        OUTPUT_FILE.write(f'raiz {index};polimento em f({function.variable}) \n')
+        root = newton_raphson_solve(function, deflated_root, stop_condition).next_point
+
+        if any(abs(root - previous_root) <= duplicate_tolerance for previous_root in roots):
+            root = deflated_root
+
+        deflated_roots.append(deflated_root)
+        roots.append(root)
+
+    return DeflationSolution(roots, deflated_roots)
+
+def group_roots(points: np.ndarray, tolerance: float):
+    if len(points) == 0:
+        return np.array([]), np.array([], dtype=int)
+
+    order = np.argsort(points)
+    sorted_points = points[order]
+    group_ids = np.concatenate(([0], np.cumsum(np.diff(sorted_points) > tolerance)))
+
+    roots = np.array([np.mean(sorted_points[group_ids == group]) for group in range(group_ids[-1] + 1)])
+    indexes = np.empty(len(points), dtype=int)
+    indexes[order] = group_ids
+
+    return roots, indexes
+
+def newton_raphson_batch_solve(function: Function, starting_points: list[Decimal], stop_condition: StopCondition):
+    OUTPUT_FILE.write('#;x[0];raiz;nº da raiz;iterações \n')
+    function = prepare_differential(function, starting_points[0])
+
+    tolerance = float(stop_condition.value)
+    initial_points = np.array([float(point) for point in starting_points])
+    points = initial_points.copy()
+    iterations = np.zeros(len(points), dtype=int)
+    converged = np.zeros(len(points), dtype=bool)
+    active = np.ones(len(points), dtype=bool)
+
+    iteration = 0
+    while active.any() and iteration <= 9999:
+        iteration += 1
+        indexes = np.flatnonzero(active)
+
+        values, differentials = solve_expressions_array((function.expression, function.differential), {function.variable: points[indexes]})
+        with np.errstate(all='ignore'):
+            steps = values / differentials
+        next_points = points[indexes] - steps
+
+        finite = np.isfinite(next_points)
+        points[indexes[finite]] = next_points[finite]
+        iterations[indexes] = iteration
+
+        done = finite & (np.abs(steps) <= tolerance)
+        converged[indexes[done]] = True
+        active[indexes[done | ~finite]] = False
+
+    roots, root_indexes = group_roots(points[converged], max(10 * tolerance, np.finfo(float).eps))
+    basin = np.full(len(points), -1)
+    basin[converged] = root_indexes
+
+    for index in range(len(points)):
+        root = f'{roots[basin[index]]:.15f}' if basin[index] >= 0 else '-'
+        OUTPUT_FILE.write(f'{index + 1};{initial_points[index]:.15f};{root};{basin[index] + 1 if basin[index] >= 0 else "-"};{iterations[index]} \n'.replace('.', ','))
+
+    return BatchSolution(initial_points, points, [Decimal(str(root)) for root in roots], basin, iterations)
+
+def group_complex_roots(points: np.ndarray, tolerance: float):
+    roots = []
+    indexes = np.full(len(points), -1)
+    remaining = np.arange(len(points))
+
+    while len(remaining) > 0:
+        group = np.abs(points[remaining] - points[remaining[0]]) <= tolerance
+        indexes[remaining[group]] = len(roots)
+        roots.append(np.mean(points[remaining[group]]))
+        remaining = remaining[~group]
+
+    order = np.lexsort((np.imag(roots), np.real(roots)))
+    ranks = np.empty(len(roots), dtype=int)
+    ranks[order] = np.arange(len(roots))
+
+    return np.array(roots)[order], ranks[indexes]
+
+def polish_complex_root(function: Function, root: complex):
+    with mpmath.workdps(getcontext().prec):
+        tolerance = mpmath.mpf(10) ** (-(getcontext().prec - 5))
+        point = mpmath.mpc(root)
+
+        for _ in range(MAX_POLISH_ITERATIONS):
+            differential = solve_expression_complex(function.differential, {function.variable: point})
+            if differential == 0:
+                break
+
+            step = solve_expression_complex(function.expression, {function.variable: point}) / differential
+            point -= step
+
+            if abs(step) <= tolerance * max(abs(point), 1):
+                break
+
+        return point
+
+def newton_raphson_complex_solve(function: Function, grid: ComplexGrid, stop_condition: StopCondition):
+    OUTPUT_FILE.write('#;Re(raiz);Im(raiz);|f(raiz)|;pontos na bacia \n')
+    if function.differential is None:
+        function = Function(function.expression, differentiate_expression(function.expression, function.variable), function.variable)
+
+    tolerance = float(stop_condition.value)
+    real, imaginary = np.meshgrid(grid.real, grid.imaginary)
+    points = (real + (1j * imaginary)).ravel()
+    iterations = np.zeros(len(points), dtype=int)
+    converged = np.zeros(len(points), dtype=bool)
+    active = np.ones(len(points), dtype=bool)
+
+    iteration = 0
+    while active.any() and iteration <= 9999:
+        iteration += 1
+        indexes = np.flatnonzero(active)
+
+        values, differentials = solve_expressions_array((function.expression, function.differential), {function.variable: points[indexes]}, complex)
+        with np.errstate(all='ignore'):
+            steps = values / differentials
+        next_points = points[indexes] - steps
+
+        finite = np.isfinite(next_points)
+        points[indexes[finite]] = next_points[finite]
+        iterations[indexes] = iteration
+
+        done = finite & (np.abs(steps) <= tolerance)
+        converged[indexes[done]] = True
+        active[indexes[done | ~finite]] = False
+
+    roots, root_indexes = group_complex_roots(points[converged], max(10 * tolerance, np.finfo(float).eps))
+    basins = np.full(len(points), -1)
+    basins[converged] = root_indexes
+
+    polished_roots = [polish_complex_root(function, complex(root)) for root in roots]
+    for index, root in enumerate(polished_roots):
+        with mpmath.workdps(getcontext().prec):
+            residual = abs(solve_expression_complex(function.expression, {function.variable: root}))
+            OUTPUT_FILE.write(f'{index + 1};{Decimal(str(root.real)):.15f};{Decimal(str(root.imag)):.15f};{float(residual):.15e};{np.count_nonzero(basins == index)} \n'.replace('.', ','))
+
+    return ComplexSolution(polished_roots, basins.reshape(real.shape), iterations.reshape(real.shape))
 
 INPUT_PATH = 'input.json'
 OUTPUT_PATH = 'output.csv'
-OUTPUT_FILE = get_out_file(OUTPUT_PATH)
-
+BASINS_PATH = 'output.npy'
 if __name__ == '__main__':
-    
+    OUTPUT_FILE = get_out_file(OUTPUT_PATH)
+
     try:
         data = get_data_from_json(INPUT_PATH)
-        solution = newton_raphson_solve(data.function, data.starting_point, data.stop_condition)
-        print(f"Solução encontrada e escrita no arquivo {OUTPUT_PATH}")
+        if data.complex_grid is not None:
+            complex_solution = newton_raphson_complex_solve(data.function, data.complex_grid, data.stop_condition)
+            print(f"{len(complex_solution.roots)} raízes complexas encontradas e escritas no arquivo {OUTPUT_PATH}")
+            if data.complex_grid.basins:
+                np.save(f'{os.path.dirname(os.path.realpath(__file__))}/{BASINS_PATH}', complex_solution.basins)
+                print(f"Imagem das bacias de atração escrita no arquivo {BASINS_PATH}")
+        elif data.starting_points is not None:
+            solution = newton_raphson_batch_solve(data.function, data.starting_points, data.stop_condition)
+            print(f"{len(solution.roots)} raízes encontradas a partir de {len(solution.starting_points)} pontos iniciais: {', '.join([f'{root:.15f}' for root in solution.roots])}")
+            print(f"Mapa de bacias de atração escrito no arquivo {OUTPUT_PATH}")
+        elif data.deflation_roots is not None:
+            deflation_solution = newton_raphson_deflation_solve(data.function, data.starting_point, data.stop_condition, data.deflation_roots)
+            print(f"{len(deflation_solution.roots)} raízes encontradas por deflação e escritas no arquivo {OUTPUT_PATH}")
+            for root in deflation_solution.roots:
+                print(f"{data.function.variable} = {root:.15f}")
+        elif data.mixed_precision:
+            mixed_solution = newton_raphson_mixed_solve(data.function, data.starting_point, data.stop_condition)
+            print(f"Solução encontrada e escrita no arquivo {OUTPUT_PATH}: {mixed_solution.solution.next_point}")
+            print(f"Fase float64: {mixed_solution.float_iterations} iterações em {mixed_solution.float_time * 1000:.3f} ms")
+            print(f"Fase decimal ({getcontext().prec} dígitos): {mixed_solution.precise_iterations} iterações em {mixed_solution.precise_time * 1000:.3f} ms")
+        else:
+            solution = newton_raphson_solve(data.function, data.starting_point, data.stop_condition, data.order, data.multiplicity, data.detect_multiplicity)
+            print(f"Solução encontrada e escrita no arquivo {OUTPUT_PATH}")
+            if solution.multiplicity > 1:
+                print(f"Multiplicidade da raiz: {solution.multiplicity}")
     except SolutionException as ex:
         print(ex)
     except KeyError as e:
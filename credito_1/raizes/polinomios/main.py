@@ -0,0 +1,221 @@
+from dataclasses import dataclass
+from enum import Enum
+import os
+import sys
+import json
+from decimal import Decimal, getcontext
+
+import mpmath
+import numpy as np
+from sympy import Poly, PolynomialError, symbols
+
+sys.path.append(os.path.realpath(f'{os.path.dirname(os.path.realpath(__file__))}/../../..'))
+
+from common.expressions import parse_expression
+
+getcontext().prec = 50
+
+MAX_ITERATIONS = 9999
+MAX_POLISH_ITERATIONS = 100
+FLOAT_EPSILON = np.finfo(float).eps
+
+class MethodType(Enum):
+    COMPANION = 1
+    ABERTH = 2
+
+@dataclass
+class Function:
+    expression: str
+    variable: str
+
+@dataclass
+class InputData:
+    function: Function
+    method: MethodType
+    polish: bool
+
+    def __init__(self, function: Function, method: MethodType = MethodType.COMPANION, polish: bool = True):
+        self.function = function
+        self.method = method
+        self.polish = polish
+
+    def __str__(self):
+        return f'f({self.function.variable}) = {self.function.expression}'
+
+@dataclass
+class Root:
+    real: Decimal
+    imaginary: Decimal
+    residual: Decimal
+
+    def is_real(self):
+        return self.imaginary == 0
+
+@dataclass
+class Solution:
+    roots: list[Root]
+    iterations: int
+
+    def real_roots(self):
+        return [root.real for root in self.roots if root.is_real()]
+
+class SolutionException(Exception):
+    def __init__(self, *args):
+        super().__init__(*args)
+
+def get_data_from_json(file_path: str):
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    
+    with open(f'{dir_path}/{file_path}', 'r') as json_file:
+        data = json.load(json_file)
+
+    return InputData(
+        Function(data['function']['expression'], data['function']['variable']),
+        MethodType[data['method'].upper()] if 'method' in data else MethodType.COMPANION,
+        data['polish'] if 'polish' in data else True
+    )
+
+def get_out_file(file_path: str):
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    file = open(f'{dir_path}/{file_path}', 'w')
+
+    return file
+
+def get_coefficients(function: Function):
+    try:
+        polynomial = Poly(parse_expression(function.expression), symbols(function.variable))
+    except PolynomialError:
+        raise SolutionException(f'A expressão {function.expression} não é um polinômio em {function.variable}')
+
+    if polynomial.degree() < 1:
+        raise SolutionException('O polinômio precisa ter grau maior ou igual a 1')
+    if not all(coefficient.is_number for coefficient in polynomial.all_coeffs()):
+        raise SolutionException('Os coeficientes do polinômio devem ser numéricos')
+
+    return polynomial.all_coeffs()
+
+def get_companion_roots(coefficients: np.ndarray):
+    normalized = coefficients[1:] / coefficients[0]
+    n = len(normalized)
+
+    companion = np.zeros((n, n), dtype=complex)
+    companion[0, :] = -normalized
+    companion[1:, :-1] = np.eye(n - 1)
+
+    return np.linalg.eigvals(companion), 1
+
+def get_aberth_roots(coefficients: np.ndarray):
+    n = len(coefficients) - 1
+    derivative = np.polyder(coefficients)
+
+    radius = 1 + np.max(np.abs(coefficients[1:] / coefficients[0]))
+    angles = (2 * np.pi * np.arange(n) / n) + 0.4
+    roots = radius * np.exp(1j * angles) / 2
+
+    magnitudes = np.abs(coefficients)
+    active = np.ones(n, dtype=bool)
+    iteration = 0
+    while active.any() and iteration < MAX_ITERATIONS:
+        iteration += 1
+
+        with np.errstate(all='ignore'):
+            values = np.polyval(coefficients, roots)
+            ratio = values / np.polyval(derivative, roots)
+            differences = roots[:, np.newaxis] - roots[np.newaxis, :]
+            np.fill_diagonal(differences, np.inf)
+            repulsion = np.sum(1 / differences, axis=1)
+            corrections = ratio / (1 - (ratio * repulsion))
+
+        active &= np.abs(values) > (FLOAT_EPSILON * np.polyval(magnitudes, np.abs(roots)))
+
+        corrections[~np.isfinite(corrections)] = 0
+        corrections[~active] = 0
+        roots = roots - corrections
+
+        active &= np.abs(corrections) > (FLOAT_EPSILON * np.maximum(np.abs(roots), 1))
+
+    if active.any():
+        raise SolutionException(f'O método de Aberth não convergiu em {MAX_ITERATIONS} iterações')
+
+    return roots, iteration
+
+def get_polish_tolerance():
+    return mpmath.mpf(10) ** (-(getcontext().prec - 5))
+
+def polish_root(coefficients: list, root: complex):
+    tolerance = get_polish_tolerance()
+    point = mpmath.mpc(root)
+
+    for _ in range(MAX_POLISH_ITERATIONS):
+        value, derivative = mpmath.polyval(coefficients, point, derivative=True)
+        if derivative == 0:
+            break
+
+        step = value / derivative
+        point -= step
+
+        if abs(step) <= tolerance * max(abs(point), 1):
+            break
+
+    return point
+
+def is_real_root(coefficients: list, point: mpmath.mpc, epsilon: mpmath.mpf):
+    if abs(point.imag) <= epsilon * max(abs(point), 1):
+        return True
+
+    real_point = mpmath.mpf(point.real)
+    error_bound = epsilon * mpmath.polyval([abs(coefficient) for coefficient in coefficients], abs(real_point))
+
+    return abs(mpmath.polyval(coefficients, real_point)) <= abs(mpmath.polyval(coefficients, point)) + error_bound
+
+def polynomial_solve(function: Function, method: MethodType = MethodType.COMPANION, polish: bool = True):
+    OUTPUT_FILE.write('#;Re(x);Im(x);|p(x)|\n')
+    coefficients = get_coefficients(function)
+    float_coefficients = np.array([complex(coefficient) for coefficient in coefficients])
+
+    if method == MethodType.ABERTH:
+        float_roots, iterations = get_aberth_roots(float_coefficients)
+    else:
+        float_roots, iterations = get_companion_roots(float_coefficients)
+
+    roots = []
+    with mpmath.workdps(getcontext().prec):
+        precise_coefficients = [mpmath.mpmathify(coefficient.evalf(getcontext().prec)) for coefficient in coefficients]
+        epsilon = get_polish_tolerance() if polish else mpmath.mpf(FLOAT_EPSILON)
+
+        for float_root in float_roots:
+            point = polish_root(precise_coefficients, complex(float_root)) if polish else mpmath.mpc(complex(float_root))
+
+            if is_real_root(precise_coefficients, point, epsilon):
+                point = mpmath.mpc(point.real, 0)
+
+            residual = abs(mpmath.polyval(precise_coefficients, point))
+            roots.append(Root(Decimal(str(point.real)), Decimal(str(point.imag)), Decimal(str(residual))))
+
+    roots.sort(key=lambda root: (not root.is_real(), root.real, root.imaginary))
+
+    for index, root in enumerate(roots, start=1):
+        OUTPUT_FILE.write(f'{index};{root.real:.15f};{root.imaginary:.15f};{root.residual:.15e} \n'.replace('.', ','))
+
+    return Solution(roots, iterations)
+
+INPUT_PATH = 'input.json'
+OUTPUT_PATH = 'output.csv'
+OUTPUT_FILE = get_out_file(OUTPUT_PATH)
+
+if __name__ == '__main__':
+    
+    try:
+        data = get_data_from_json(INPUT_PATH)
+        solution = polynomial_solve(data.function, data.method, data.polish)
+        print(f"{len(solution.roots)} raízes encontradas ({len(solution.real_roots())} reais) e escritas no arquivo {OUTPUT_PATH}")
+        for root in solution.real_roots():
+            print(f"{data.function.variable} = {root}")
+    except SolutionException as ex:
+        print(ex)
+    except KeyError as e:
+        print(f"Formato de entrada inválido. Chave faltando: {e}")
+    except Exception as e:
+        print(f'Erro ao solucionar o problema: {e}')
+    
+    OUTPUT_FILE.close()
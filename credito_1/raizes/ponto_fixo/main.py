@@ -0,0 +1,240 @@
+from dataclasses import dataclass
+from enum import Enum
+import os
+import sys
+import json
+from decimal import Decimal, getcontext
+
+sys.path.append(os.path.realpath(f'{os.path.dirname(os.path.realpath(__file__))}/../../..'))
+
+from common.expressions import differentiate_expression, solve_expression
+
+getcontext().prec = 50
+
+CONTRACTION_NEIGHBORHOOD = Decimal('0.1')
+
+class StopConditionType(Enum):
+    ERROR = 1
+    INTERVALSIZE = 2
+
+class AccelerationType(Enum):
+    NONE = 1
+    AITKEN = 2
+    STEFFENSEN = 3
+
+@dataclass
+class Function:
+    expression: str
+    variable: str
+
+@dataclass 
+class StopCondition:
+    type: StopConditionType
+    value: Decimal
+
+@dataclass
+class InputData:
+    function: Function
+    x0: Decimal
+    stop_condition: StopCondition
+    acceleration: AccelerationType
+
+    def __init__(self, function: Function, x0: Decimal, stop_condition: StopCondition, acceleration: AccelerationType = AccelerationType.NONE):
+        self.function = function
+        self.x0 = x0
+        self.stop_condition = stop_condition
+        self.acceleration = acceleration
+
+    def __str__(self):
+        return f'{self.function.variable} = {self.function.expression}; {self.function.variable} = {self.x0}'
+
+@dataclass
+class Solution:
+    point: Decimal
+    next_point: Decimal
+    error: Decimal
+    contraction: Decimal | None
+
+class SolutionException(Exception):
+    def __init__(self, *args):
+        super().__init__(*args)
+
+def get_data_from_json(file_path: str):
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    
+    with open(f'{dir_path}/{file_path}', 'r') as json_file:
+        data = json.load(json_file)
+
+    stop_condition = StopCondition(StopConditionType.ERROR, Decimal(str(data['stop_condition']['error'])))
+
+    return InputData(
+        Function(data['function']['expression'], data['function']['variable']),
+        Decimal(str(data['x0'])),
+        stop_condition,
+        AccelerationType[data['acceleration'].upper()] if 'acceleration' in data else AccelerationType.NONE
+    )
+
+def get_out_file(file_path: str):
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    file = open(f'{dir_path}/{file_path}', 'w')
+
+    return file
+
+def solve_function(function: Function, variable_value: Decimal):
+    return solve_expression(function.expression, {function.variable: variable_value})
+
+def check_contraction(function: Function, starting_point: Decimal):
+    differential = differentiate_expression(function.expression, function.variable)
+    points = [starting_point - CONTRACTION_NEIGHBORHOOD, starting_point, starting_point + CONTRACTION_NEIGHBORHOOD]
+    values = []
+
+    for point in points:
+        try:
+            value = solve_expression(differential, {function.variable: point})
+        except (ArithmeticError, ValueError):
+            continue
+
+        if value.is_finite():
+            values.append(abs(value))
+
+    if len(values) == 0:
+        return None
+
+    bound = max(values)
+
+    if bound >= 1:
+        return f'|g\'({function.variable})| = {bound:.6f} >= 1 perto de {function.variable} = {starting_point}; a iteração de ponto fixo pode não convergir'
+
+    return None
+
+def get_aitken_point(point: Decimal, next_point: Decimal, following_point: Decimal):
+    denominator = following_point - (2 * next_point) + point
+
+    if denominator == 0:
+        return None
+
+    return point - (((next_point - point) ** 2) / denominator)
+
+def get_contraction(step: Decimal, previous_step: Decimal | None):
+    if previous_step is None or previous_step == 0:
+        return None
+
+    return abs(step / previous_step)
+
+def format_optional(value: Decimal | None):
+    return f'{value:.15f}' if value is not None else '-'
+
+def solve_for_fp(function: Function, point: Decimal, iteration: int, previous_step: Decimal | None):
+    next_point = solve_function(function, point)
+    step = next_point - point
+    contraction = get_contraction(step, previous_step)
+
+    OUTPUT_FILE.write(f'{iteration};{point:.15f};{next_point:.15f};{abs(step):.15f};{format_optional(contraction)} \n'.replace('.', ','))
+
+    return Solution(point, next_point, abs(step), contraction), step
+
+def solve_for_steffensen(function: Function, point: Decimal, iteration: int):
+    next_point = solve_function(function, point)
+    following_point = solve_function(function, next_point)
+    contraction = get_contraction(following_point - next_point, next_point - point)
+    accelerated_point = get_aitken_point(point, next_point, following_point)
+
+    if accelerated_point is None:
+        accelerated_point = following_point
+
+    error = abs(accelerated_point - point)
+
+    OUTPUT_FILE.write(f'{iteration};{point:.15f};{next_point:.15f};{following_point:.15f};{accelerated_point:.15f};{error:.15f};{format_optional(contraction)} \n'.replace('.', ','))
+
+    return Solution(point, accelerated_point, error, contraction)
+
+def fixed_point_solve(function: Function, x0: Decimal, stop_condition: StopCondition):
+    OUTPUT_FILE.write('#;x[k];x[k+1] = g(x[k]);|x[k+1] - x[k]|;fator de contração \n')
+
+    iteration = 1
+    solution, step = solve_for_fp(function, x0, iteration, None)
+
+    while((abs(solution.error) > stop_condition.value) and iteration <= 9999):
+        iteration += 1
+        solution, step = solve_for_fp(function, solution.next_point, iteration, step)
+
+    if iteration > 9999:
+        raise SolutionException("Não foi possível encontrar um resultado em 9999 iterações")
+
+    return solution
+
+def aitken_solve(function: Function, x0: Decimal, stop_condition: StopCondition):
+    OUTPUT_FILE.write('#;x[k];g(x[k]);g(g(x[k]));x̂[k] = x[k] - (g(x[k]) - x[k])² / (g(g(x[k])) - 2g(x[k]) + x[k]);|x̂[k] - x̂[k-1]|;fator de contração \n')
+
+    points = [x0, solve_function(function, x0)]
+    previous_accelerated_point = None
+    iteration = 0
+
+    while iteration <= 9999:
+        iteration += 1
+        points.append(solve_function(function, points[-1]))
+        point, next_point, following_point = points[-3:]
+
+        accelerated_point = get_aitken_point(point, next_point, following_point)
+        if accelerated_point is None:
+            accelerated_point = following_point
+
+        error = abs(accelerated_point - previous_accelerated_point) if previous_accelerated_point is not None else None
+        contraction = get_contraction(following_point - next_point, next_point - point)
+
+        OUTPUT_FILE.write(f'{iteration};{point:.15f};{next_point:.15f};{following_point:.15f};{accelerated_point:.15f};{format_optional(error)};{format_optional(contraction)} \n'.replace('.', ','))
+
+        if error is not None and error <= stop_condition.value:
+            return Solution(point, accelerated_point, error, contraction)
+
+        previous_accelerated_point = accelerated_point
+
+    raise SolutionException("Não foi possível encontrar um resultado em 9999 iterações")
+
+def steffensen_solve(function: Function, x0: Decimal, stop_condition: StopCondition):
+    OUTPUT_FILE.write('#;x[k];g(x[k]);g(g(x[k]));x[k+1] = x[k] - (g(x[k]) - x[k])² / (g(g(x[k])) - 2g(x[k]) + x[k]);|x[k+1] - x[k]|;fator de contração \n')
+
+    iteration = 1
+    solution: Solution = solve_for_steffensen(function, x0, iteration)
+
+    while((abs(solution.error) > stop_condition.value) and iteration <= 9999):
+        iteration += 1
+        solution = solve_for_steffensen(function, solution.next_point, iteration)
+
+    if iteration > 9999:
+        raise SolutionException("Não foi possível encontrar um resultado em 9999 iterações")
+
+    return solution
+
+def fixed_point_accelerated_solve(function: Function, x0: Decimal, stop_condition: StopCondition, acceleration: AccelerationType = AccelerationType.NONE):
+    mismatch = check_contraction(function, x0)
+    if mismatch is not None:
+        print(f'Aviso: {mismatch}')
+
+    if acceleration == AccelerationType.AITKEN:
+        return aitken_solve(function, x0, stop_condition)
+    if acceleration == AccelerationType.STEFFENSEN:
+        return steffensen_solve(function, x0, stop_condition)
+
+    return fixed_point_solve(function, x0, stop_condition)
+
+INPUT_PATH = 'input.json'
+OUTPUT_PATH = 'output.csv'
+OUTPUT_FILE = get_out_file(OUTPUT_PATH)
+
+if __name__ == '__main__':
+    
+    try:
+        data = get_data_from_json(INPUT_PATH)
+        solution = fixed_point_accelerated_solve(data.function, data.x0, data.stop_condition, data.acceleration)
+        print(f"Solução encontrada e escrita no arquivo {OUTPUT_PATH}")
+        if solution.contraction is not None:
+            print(f"Fator de contração estimado: {solution.contraction:.6f}")
+    except SolutionException as ex:
+        print(ex)
+    except KeyError as e:
+        print(f"Formato de entrada inválido. Chave faltando: {e}")
+    except Exception as e:
+        print(f'Erro ao solucionar o problema: {e}')
+    
+    OUTPUT_FILE.close()
@@ -1,17 +1,28 @@
 from dataclasses import dataclass
 from enum import Enum
 import os
+import sys
 import traceback
-from sympy import sympify, symbols, N
 import json
 from decimal import Decimal, getcontext
 
+sys.path.append(os.path.realpath(f'{os.path.dirname(os.path.realpath(__file__))}/../../..'))
+
+from common.bracketing import MAX_EVALUATIONS, BracketingException, BracketingState
+from common.expressions import solve_expression
+
 getcontext().prec = 50
 
 class StopConditionType(Enum):
     ERROR = 1
     INTERVALSIZE = 2
 
+class ModificationType(Enum):
+    STANDARD = 1
+    ILLINOIS = 2
+    PEGASUS = 3
+    ANDERSON_BJORCK = 4
+
 @dataclass
 class Function:
     expression: str
@@ -32,11 +43,15 @@ class InputData:
     function: Function
     interval: Interval
     stop_condition: StopCondition
+    max_evaluations: int
+    modification: ModificationType
     
-    def __init__(self, function: Function, interval: Interval, stop_condition: StopCondition):
+    def __init__(self, function: Function, interval: Interval, stop_condition: StopCondition, max_evaluations: int = MAX_EVALUATIONS, modification: ModificationType = ModificationType.STANDARD):
         self.function = function
         self.interval = interval
         self.stop_condition = stop_condition
+        self.max_evaluations = max_evaluations
+        self.modification = modification
 
     def __str__(self):
         return f'f({self.function.variable}) = {self.function.expression}; [{self.interval.start}, {self.interval.end}]'
@@ -46,6 +61,9 @@ class Solution:
     next_interval: Interval
     point: Decimal
     error: Decimal
+    evaluations: int
+    replaced_start: bool | None = None
+    iterations: int = 0
 
 class SolutionException(Exception):
     def __init__(self, *args):
@@ -67,7 +85,9 @@ def get_data_from_json(file_path: str):
     return InputData(
         Function(data['function']['expression'], data['function']['variable']), 
         Interval(Decimal(data['interval']['start']), Decimal(data['interval']['end'])),
-        stop_condition
+        stop_condition,
+        data['max_evaluations'] if 'max_evaluations' in data else MAX_EVALUATIONS,
+        ModificationType[data['modification'].upper()] if 'modification' in data else ModificationType.STANDARD
     )
 
 def get_out_file(file_path: str):
@@ -77,30 +97,39 @@ def get_out_file(file_path: str):
     return file
 
 def solve_function(function: Function, variable_value: Decimal):
-    symp_expression = sympify(function.expression)
-    symp_variable = symbols(function.variable)
-    
-    return Decimal(str(N(symp_expression.evalf(subs={symp_variable: variable_value}))))
-
-def solve_for_pf(function: Function, interval: Interval, stop_condition: StopCondition, iteration: int):
-    if (interval.end - interval.start) < 0:
-        raise SolutionException('Intervalo Inválido')
-
-    solution_interval_end = solve_function(function, interval.end)
-    solution_interval_start = solve_function(function, interval.start)
+    return solve_expression(function.expression, {function.variable: variable_value})
+
+def get_modification_factor(modification: ModificationType, replaced_value: Decimal, new_value: Decimal):
+    if modification == ModificationType.ILLINOIS:
+        return Decimal(1) / 2
+    if modification == ModificationType.PEGASUS:
+        return replaced_value / (replaced_value + new_value)
+    if modification == ModificationType.ANDERSON_BJORCK:
+        factor = 1 - (new_value / replaced_value)
+        return factor if factor > 0 else Decimal(1) / 2
+
+    return Decimal(1)
+
+def solve_for_pf(state: BracketingState, stop_condition: StopCondition, iteration: int, modification: ModificationType = ModificationType.STANDARD, previous_replaced_start: bool | None = None):
+    interval = Interval(state.start, state.end)
+    solution_interval_start = state.value_at_start
+    solution_interval_end = state.value_at_end
     
     interval_section = Decimal(((interval.start * solution_interval_end) - (interval.end * solution_interval_start)) / (solution_interval_end - solution_interval_start))
     
-    solution_interval_section = solve_function(function, interval_section)
+    solution_interval_section = state.evaluate(interval_section)
+    replaced_start = (solution_interval_start * solution_interval_section) > 0
+    replaced_value = solution_interval_start if replaced_start else solution_interval_end
+    state.update(interval_section, solution_interval_section)
 
-    signal_change_for_start = (solution_interval_start * solution_interval_section) < 0
-    signal_change_for_end = (solution_interval_end * solution_interval_section) < 0
+    if solution_interval_section != 0 and replaced_start == previous_replaced_start:
+        factor = get_modification_factor(modification, replaced_value, solution_interval_section)
+        if replaced_start:
+            state.value_at_end *= factor
+        else:
+            state.value_at_start *= factor
 
-    if not signal_change_for_start and not signal_change_for_end:
-        raise SolutionException('Não houve mudança de sinais, não é possível encontrar uma solução!')
-    
-    if signal_change_for_start: new_interval = Interval(interval.start, interval_section)
-    if signal_change_for_end: new_interval = Interval(interval_section, interval.end)
+    new_interval = Interval(state.start, state.end)
 
     OUTPUT_FILE.write(f'{iteration};{new_interval.start:.15f};{new_interval.end:.15f};{solution_interval_start:.15f};{solution_interval_end:.15f};{interval_section:.15f};{solution_interval_section:.15f} \n'.replace('.', ','))
 
@@ -109,36 +138,46 @@ def solve_for_pf(function: Function, interval: Interval, stop_condition: StopCon
     elif(stop_condition.type == StopConditionType.INTERVALSIZE):
         condition_value = abs(new_interval.end - new_interval.start)
 
-    return Solution(new_interval, interval_section, condition_value)
+    return Solution(new_interval, interval_section, condition_value, state.evaluations, replaced_start)
 
-def false_position_solve(function: Function, interval: Interval, stop_condition: StopCondition):
+def false_position_solve(function: Function, interval: Interval, stop_condition: StopCondition, max_evaluations: int = MAX_EVALUATIONS, modification: ModificationType = ModificationType.STANDARD):
     OUTPUT_FILE.write('#;a;b;f(a);f(b);c;f(c)\n')
     if((interval.end - interval.start) == 0):
-        return solve_function(function, interval.end)
+        return Solution(interval, interval.end, abs(solve_function(function, interval.end)), 1)
+
+    state = BracketingState(lambda value: solve_function(function, value), interval.start, interval.end, max_evaluations)
+
+    if not state.has_signal_change():
+        raise SolutionException('Não houve mudança de sinais, não é possível encontrar uma solução!')
+    if state.value_at_start == 0:
+        return Solution(interval, interval.start, Decimal(0), state.evaluations)
+    if state.value_at_end == 0:
+        return Solution(interval, interval.end, Decimal(0), state.evaluations)
     
     iteration = 1
-    solution: Solution = solve_for_pf(function, interval, stop_condition, iteration)
+    solution: Solution = solve_for_pf(state, stop_condition, iteration, modification)
     
     while((abs(solution.error) > abs(stop_condition.value)) and iteration <= 9999):
         iteration += 1
-        solution = solve_for_pf(function, solution.next_interval, stop_condition, iteration)
+        solution = solve_for_pf(state, stop_condition, iteration, modification, solution.replaced_start)
 
     if iteration > 9999:
         raise SolutionException("Não foi possível encontrar um resultado em 9999 iterações")
 
-    return solution.point
+    solution.iterations = iteration
+    return solution
 
 INPUT_PATH = 'input.json'
 OUTPUT_PATH = 'output.csv'
-OUTPUT_FILE = get_out_file(OUTPUT_PATH)
-
 if __name__ == '__main__':
-    
+    OUTPUT_FILE = get_out_file(OUTPUT_PATH)
+
     try:
         data = get_data_from_json(INPUT_PATH)
-        solution = false_position_solve(data.function, data.interval, data.stop_condition)
+        solution = false_position_solve(data.function, data.interval, data.stop_condition, data.max_evaluations, data.modification)
         print(f"Solução encontrada e escrita no arquivo {OUTPUT_PATH}")
-    except SolutionException as ex:
+        print(f"Avaliações da função: {solution.evaluations}")
+    except (SolutionException, BracketingException) as ex:
         print(ex)
     except KeyError as e:
         print(f"Formato de entrada inválido. Chave faltando: {e}")
@@ -1,11 +1,15 @@
 from dataclasses import dataclass
 from enum import Enum
 import os
+import sys
 import traceback
-from sympy import sympify, symbols, N
 import json
 from decimal import Decimal, getcontext
 
+sys.path.append(os.path.realpath(f'{os.path.dirname(os.path.realpath(__file__))}/../../..'))
+
+from common.expressions import solve_expression
+
 getcontext().prec = 50
 
 class StopConditionType(Enum):
@@ -44,6 +48,7 @@ class Solution:
     value: Decimal
     next_point: Decimal
     error: Decimal
+    iterations: int = 0
 
 class SolutionException(Exception):
     def __init__(self, *args):
@@ -71,16 +76,10 @@ def get_out_file(file_path: str):
     return file
 
 def solve_function(function: Function, variable_value: Decimal):
-    symp_expression = sympify(function.expression)
-    symp_variable = symbols(function.variable)
-    
-    return Decimal(str(N(symp_expression.evalf(subs={symp_variable: variable_value}))))
+    return solve_expression(function.expression, {function.variable: variable_value})
 
 def solve_differential(function: Function, variable_value: Decimal):
-    symp_expression = sympify(function.differential)
-    symp_variable = symbols(function.variable)
-    
-    return Decimal(str(N(symp_expression.evalf(subs={symp_variable: variable_value}))))
+    return solve_expression(function.differential, {function.variable: variable_value})
 
 def solve_for_nr(function: Function, point: Decimal, previous_solution_for_function: Decimal, previous_point: Decimal, iteration: int):
     solution_for_function = solve_function(function, point)
@@ -112,14 +111,14 @@ def newton_raphson_solve(function: Function, x0: Decimal, x1: Decimal, stop_cond
     if iteration > 9999:
         raise SolutionException("Não foi possível encontrar um resultado em 9999 iterações")
     
-    return previous_point
+    solution.iterations = iteration
+    return solution
 
 INPUT_PATH = 'input.json'
 OUTPUT_PATH = 'output.csv'
-OUTPUT_FILE = get_out_file(OUTPUT_PATH)
-
 if __name__ == '__main__':
-    
+    OUTPUT_FILE = get_out_file(OUTPUT_PATH)
+
     try:
         data = get_data_from_json(INPUT_PATH)
         solution = newton_raphson_solve(data.function, data.x0, data.x1, data.stop_condition)
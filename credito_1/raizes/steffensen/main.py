@@ -0,0 +1,140 @@
+from dataclasses import dataclass
+from enum import Enum
+import os
+import sys
+import json
+from decimal import Decimal, getcontext
+
+sys.path.append(os.path.realpath(f'{os.path.dirname(os.path.realpath(__file__))}/../../..'))
+
+from common.convergence import get_convergence_order
+from common.expressions import solve_expression
+
+getcontext().prec = 50
+
+class StopConditionType(Enum):
+    ERROR = 1
+    INTERVALSIZE = 2
+
+@dataclass
+class Function:
+    expression: str
+    variable: str
+
+@dataclass 
+class StopCondition:
+    type: StopConditionType
+    value: Decimal
+
+@dataclass
+class InputData:
+    function: Function
+    x0: Decimal
+    stop_condition: StopCondition
+
+    def __str__(self):
+        return f'f({self.function.variable}) = {self.function.expression}; {self.function.variable} = {self.x0}'
+
+@dataclass
+class Solution:
+    value: Decimal
+    next_point: Decimal
+    error: Decimal
+    evaluations: int
+    iterations: int = 0
+
+class SolutionException(Exception):
+    def __init__(self, *args):
+        super().__init__(*args)
+
+def get_data_from_json(file_path: str):
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    
+    with open(f'{dir_path}/{file_path}', 'r') as json_file:
+        data = json.load(json_file)
+
+    stop_condition = StopCondition(StopConditionType.ERROR, Decimal(str(data['stop_condition']['error'])))
+
+    return InputData(
+        Function(data['function']['expression'], data['function']['variable']),
+        Decimal(str(data['x0'])),
+        stop_condition
+    )
+
+def get_out_file(file_path: str):
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    file = open(f'{dir_path}/{file_path}', 'w')
+
+    return file
+
+def solve_function(function: Function, variable_value: Decimal):
+    return solve_expression(function.expression, {function.variable: variable_value})
+
+def solve_for_steffensen(function: Function, point: Decimal, solution_for_function: Decimal, iteration: int, errors: list[Decimal]):
+    if solution_for_function == 0:
+        OUTPUT_FILE.write(f'{iteration};{point:.15f};{solution_for_function:.15f}; - ;{point:.15f};{0:.15f}; - \n'.replace('.', ','))
+        return Solution(solution_for_function, point, Decimal(0), 0)
+
+    solution_for_shifted = solve_function(function, point + solution_for_function)
+    if not solution_for_shifted.is_finite():
+        raise SolutionException(f"f(x + f(x)) não é finito em {function.variable} = {point}")
+
+    denominator = solution_for_shifted - solution_for_function
+
+    if denominator == 0:
+        raise SolutionException("Não é possível dividir por 0")
+
+    next_point = point - ((solution_for_function ** 2) / denominator)
+    error = abs(next_point - point)
+    convergence_order = get_convergence_order([*errors, error])
+
+    OUTPUT_FILE.write(f'{iteration};{point:.15f};{solution_for_function:.15f};{solution_for_shifted:.15f};{next_point:.15f};{error:.15f};{f"{convergence_order:.6f}" if convergence_order is not None else "-"} \n'.replace('.', ','))
+
+    if error == 0:
+        raise SolutionException(f"O método estagnou em {function.variable} = {point}, onde f({function.variable}) = {solution_for_function:.6e} não é uma raiz")
+
+    return Solution(solution_for_function, next_point, error, 1)
+
+def steffensen_solve(function: Function, x0: Decimal, stop_condition: StopCondition):
+    OUTPUT_FILE.write('#;x[k];f(x[k]);f(x[k] + f(x[k]));x[k+1] = x[k] - f(x[k])² / (f(x[k] + f(x[k])) - f(x[k]));x[k+1] - x[k];ordem observada \n')
+
+    point = x0
+    solution_for_function = solve_function(function, point)
+    errors = []
+    evaluations = 1
+
+    for iteration in range(1, 10000):
+        solution: Solution = solve_for_steffensen(function, point, solution_for_function, iteration, errors)
+        evaluations += solution.evaluations
+
+        if solution.error == 0:
+            return Solution(solution_for_function, point, Decimal(0), evaluations, iteration)
+
+        errors.append(solution.error)
+        point = solution.next_point
+        solution_for_function = solve_function(function, point)
+        evaluations += 1
+
+        if solution.error <= stop_condition.value and abs(solution_for_function) <= stop_condition.value:
+            return Solution(solution_for_function, point, solution.error, evaluations, iteration)
+
+    raise SolutionException("Não foi possível encontrar um resultado em 9999 iterações")
+
+INPUT_PATH = 'input.json'
+OUTPUT_PATH = 'output.csv'
+if __name__ == '__main__':
+    OUTPUT_FILE = get_out_file(OUTPUT_PATH)
+
+    try:
+        data = get_data_from_json(INPUT_PATH)
+        solution = steffensen_solve(data.function, data.x0, data.stop_condition)
+        print(f"Solução encontrada e escrita no arquivo {OUTPUT_PATH}")
+        print(f"Avaliações da função: {solution.evaluations}")
+    except SolutionException as ex:
+        print(ex)
+    except KeyError as e:
+        print(f"Formato de entrada inválido. Chave faltando: {e}")
+    except Exception as e:
+        print(f'Erro ao solucionar o problema: {e}')
+    
+    OUTPUT_FILE.close()
@@ -0,0 +1,140 @@
+from dataclasses import dataclass
+import importlib.util
+import math
+import os
+import sys
+import json
+import time
+from decimal import Decimal, getcontext
+
+import numpy as np
+
+sys.path.append(os.path.realpath(f'{os.path.dirname(os.path.realpath(__file__))}/../../..'))
+
+from common.linear_systems import LU_BLOCK_SIZE, blocked_lu
+
+getcontext().prec = 50
+
+REPETITIONS = 3
+
+@dataclass
+class InputData:
+    seed: int
+    block_size: int
+    sizes: list[int]
+    decimal_sizes: list[int]
+
+@dataclass
+class Result:
+    engine: str
+    size: int
+    time: float
+    residual: float
+    scaling_exponent: float | None = None
+
+    def gflops(self):
+        return (2 * self.size ** 3 / 3) / self.time / 1e9
+
+    def to_dict(self):
+        return {
+            'motor': self.engine,
+            'n': self.size,
+            'tempo_ms': round(self.time * 1000, 3),
+            'gflops': round(self.gflops(), 3),
+            'residuo_relativo': f'{self.residual:.3e}',
+            'expoente_observado': round(self.scaling_exponent, 3) if self.scaling_exponent is not None else None
+        }
+
+def get_data_from_json(file_path: str):
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    
+    with open(f'{dir_path}/{file_path}', 'r') as json_file:
+        data = json.load(json_file)
+
+    return InputData(
+        data['seed'],
+        data['block_size'] if 'block_size' in data else LU_BLOCK_SIZE,
+        data['sizes'],
+        data['decimal_sizes'] if 'decimal_sizes' in data else []
+    )
+
+def get_out_file(file_path: str):
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    file = open(f'{dir_path}/{file_path}', 'w')
+
+    return file
+
+def load_LU_module():
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    spec = importlib.util.spec_from_file_location('benchmark_fatoracao_LU', f'{dir_path}/../fatoracao_LU/main.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    module.OUTPUT_FILE.close()
+
+    return module
+
+def get_residual(matrix: np.ndarray, factorization):
+    lower = np.asarray(factorization.lower, dtype=float)
+    upper = np.asarray(factorization.upper, dtype=float)
+
+    return float(np.linalg.norm(matrix[factorization.permutation] - lower @ upper) / np.linalg.norm(matrix))
+
+def get_scaling_exponents(results: list[Result]):
+    for previous, current in zip(results, results[1:]):
+        current.scaling_exponent = math.log(current.time / previous.time) / math.log(current.size / previous.size)
+
+    return results
+
+def benchmark_engine(engine: str, factorize, matrices: dict[int, np.ndarray]):
+    results = []
+
+    for size, matrix in matrices.items():
+        factorize(matrix)
+        elapsed = math.inf
+
+        for _ in range(REPETITIONS):
+            start = time.perf_counter()
+            factorization = factorize(matrix)
+            elapsed = min(elapsed, time.perf_counter() - start)
+
+        results.append(Result(engine, size, elapsed, get_residual(matrix, factorization)))
+
+    return get_scaling_exponents(results)
+
+def benchmark_solve(data: InputData):
+    generator = np.random.default_rng(data.seed)
+    matrices = {size: generator.standard_normal((size, size)) for size in sorted(set(data.sizes) | set(data.decimal_sizes))}
+    LU_module = load_LU_module()
+
+    def decimal_factorize(matrix: np.ndarray):
+        decimal_matrix = [[Decimal(str(value)) for value in row] for row in matrix]
+        return LU_module.get_factorization(LU_module.MatrixData(decimal_matrix, [], [], precision=LU_module.PrecisionType.DECIMAL))
+
+    return [
+        *benchmark_engine(f'blocos ({data.block_size})', lambda matrix: blocked_lu(matrix, data.block_size), {size: matrices[size] for size in data.sizes}),
+        *benchmark_engine('blocos (1)', lambda matrix: blocked_lu(matrix, 1), {size: matrices[size] for size in data.sizes}),
+        *benchmark_engine('decimal', decimal_factorize, {size: matrices[size] for size in data.decimal_sizes})
+    ]
+
+INPUT_PATH = 'input.json'
+OUTPUT_PATH = 'report.json'
+
+if __name__ == '__main__':
+    
+    try:
+        data = get_data_from_json(INPUT_PATH)
+        results = benchmark_solve(data)
+
+        with get_out_file(OUTPUT_PATH) as output_file:
+            json.dump({'resultados': [result.to_dict() for result in results]}, output_file, indent=4, ensure_ascii=False)
+            output_file.write('\n')
+
+        print(f"{'motor':<14}{'n':>8}{'tempo (ms)':>14}{'GFLOP/s':>10}{'resíduo':>12}{'expoente':>10}")
+        for result in results:
+            exponent = f'{result.scaling_exponent:.3f}' if result.scaling_exponent is not None else '-'
+            print(f"{result.engine:<14}{result.size:>8}{result.time * 1000:>14.3f}{result.gflops():>10.3f}{result.residual:>12.3e}{exponent:>10}")
+        print(f"Relatório escrito no arquivo {OUTPUT_PATH}")
+    except KeyError as e:
+        print(f"Formato de entrada inválido. Chave faltando: {e}")
+    except Exception as e:
+        print(f'Erro ao executar o benchmark: {e}')
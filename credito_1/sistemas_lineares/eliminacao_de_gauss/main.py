@@ -2,10 +2,13 @@ from dataclasses import dataclass
 from enum import Enum
 from io import TextIOWrapper
 import os
-from sympy import Eq, solve, sympify, symbols, N
+import sys
 import json
 from decimal import Decimal, getcontext
-import copy
+
+sys.path.append(os.path.realpath(f'{os.path.dirname(os.path.realpath(__file__))}/../../..'))
+
+from common.linear_systems import LinearSystemException, PivotingType, back_substitution, bareiss_solve, forward_elimination, to_array, to_exact_array
 
 getcontext().prec = 50
 
@@ -14,6 +17,9 @@ class MatrixData:
     matrix: list[list[float]]
     variables: list[str]
     results: list[float]
+    pivoting: PivotingType = PivotingType.PARTIAL
+    permutation: list[int] | None = None
+    exact: bool = False
 
 class SolutionException(Exception):
     def __init__(self, *args):
@@ -28,7 +34,9 @@ def get_data_from_json(file_path: str):
     return MatrixData(
         data['matrix'],
         data['variables'],
-        data['results']
+        data['results'],
+        PivotingType[data['pivoting'].upper()] if 'pivoting' in data else PivotingType.PARTIAL,
+        exact=data['exact'] if 'exact' in data else False
     )
 
 def get_out_file(file_path: str):
@@ -46,7 +54,7 @@ def print_matrix(data: MatrixData, only_matrix: bool = False):
         line_parts.append('|')
         
         if not only_matrix:
-            line_parts.extend([data.variables[line_index], '|', '=', format_value(Decimal(data.results[line_index]))])
+            line_parts.extend([data.variables[line_index], '|', '=', format_value(data.results[line_index])])
 
         print(' '.join(line_parts))
         
@@ -59,7 +67,7 @@ def write_matrix(data: MatrixData, file: TextIOWrapper, only_matrix: bool = Fals
         line_parts.append('|')
         
         if not only_matrix:
-            line_parts.extend([data.variables[line_index], '|', '=', format_value(Decimal(data.results[line_index]))])
+            line_parts.extend([data.variables[line_index], '|', '=', format_value(data.results[line_index])])
 
         file.write(f'{' '.join(line_parts)}\n')
 
@@ -72,48 +80,17 @@ def write_dict(dictionary: dict, file: TextIOWrapper):
     for key, value in dictionary.items():
         file.write(f'{key} = {value}\n')
 
-def solve_function(expression: str, result: float, variable: str):
-    symp_expression = sympify(expression)
-    symp_variable = symbols(variable)
-    
-    return solve(Eq(symp_expression, result), symp_variable)
-
 def solve_matrix(data: MatrixData):
     invalid_matrix = check_invalid_matrix_by_input(data)
     if(invalid_matrix):
         raise(SolutionException(f'Erro: {invalid_matrix}'))
 
-    system: list[str] = []
-    solutions: dict = {}
-    for line_index in range(len(data.matrix)):
-        expression_parts = []
-        for column_index in range(len(data.matrix[line_index])):
-            expression_parts.append(f'({data.matrix[line_index][column_index]} * {data.variables[column_index]})')
-        expression = ' + '.join(expression_parts)
-        system.append(expression)
-    
-    for line_index in range(len(data.matrix) - 1, -1, -1):
-        variable = data.variables[line_index]
-        for key, value in solutions.items():
-            system[line_index] = system[line_index].replace(key, str(value))
-            
-        solution = solve_function(system[line_index], data.results[line_index], variable)
-        solutions[variable] = solution[0]
-
-    solutions = reverse_dict(solutions)
-    
-    return solutions
+    solution = back_substitution(data.matrix, data.results)
 
-def reverse_dict(dictionary: dict):
-    reversed_dictionary = {}
-    while dictionary:
-        key, value = dictionary.popitem()
-        reversed_dictionary[key] = value
-
-    return reversed_dictionary
+    return dict(zip(data.variables, solution.tolist()))
 
 def check_invalid_matrix(matrix: list):
-    if not matrix:
+    if len(matrix) == 0:
         return "Matriz vazia"
     
     num_rows = len(matrix)
@@ -140,21 +117,35 @@ def get_diagonal_matrix(input_data: MatrixData):
     if(invalid_matrix):
         raise(SolutionException(f'Erro: {invalid_matrix}'))
 
-    data = copy.deepcopy(input_data)
+    matrix = to_array(input_data.matrix)
+    results = to_array(input_data.results)
+    permutation = forward_elimination(matrix, results, input_data.pivoting)
 
-    for iteration_line_index in range(1, len(data.matrix)):
-        for line_index in range(iteration_line_index, len(data.matrix)):
-            m = data.matrix[line_index][iteration_line_index - 1] / data.matrix[iteration_line_index - 1][iteration_line_index - 1]
-            data.matrix[line_index][iteration_line_index - 1] = 0
+    return MatrixData(matrix, input_data.variables, results, input_data.pivoting, permutation.tolist())
 
-            for column_index in range(iteration_line_index, len(data.matrix[iteration_line_index])):
-                data.matrix[line_index][column_index] = data.matrix[line_index][column_index] - (m * data.matrix[iteration_line_index - 1][column_index])
-            
-            data.results[line_index] = data.results[line_index] - (m * data.results[iteration_line_index - 1])
-    
-    return data
+def exact_gauss_solve(data: MatrixData):
+    invalid_matrix = check_invalid_matrix_by_input(data)
+    if(invalid_matrix):
+        raise(SolutionException(f'Erro: {invalid_matrix}'))
+
+    exact_solution = bareiss_solve(data.matrix, data.results)
+    diagonal_matrix = MatrixData(exact_solution.matrix, data.variables, exact_solution.results)
+
+    OUTPUT_FILE.write("Matriz Original\n")
+    write_matrix(MatrixData(to_exact_array(data.matrix), data.variables, to_exact_array(data.results)), OUTPUT_FILE)
+    OUTPUT_FILE.write("\nMatriz Diagonal (Bareiss)\n")
+    write_matrix(diagonal_matrix, OUTPUT_FILE)
+    OUTPUT_FILE.write("\nPermutação das Linhas\n")
+    OUTPUT_FILE.write(f'{[int(index) + 1 for index in exact_solution.permutation]}\n')
+    OUTPUT_FILE.write("\nDeterminante\n")
+    OUTPUT_FILE.write(f'{exact_solution.determinant}\n')
+    OUTPUT_FILE.write("\nSolução\n")
+    write_dict(dict(zip(data.variables, exact_solution.solution)), OUTPUT_FILE)
 
 def gauss_solve(data: MatrixData):
+    if data.exact:
+        return exact_gauss_solve(data)
+
     diagonal_matrix = get_diagonal_matrix(data)
     solution = solve_matrix(diagonal_matrix)
 
@@ -162,6 +153,8 @@ def gauss_solve(data: MatrixData):
     write_matrix(data, OUTPUT_FILE)
     OUTPUT_FILE.write("\nMatriz Diagonal\n")
     write_matrix(diagonal_matrix, OUTPUT_FILE)
+    OUTPUT_FILE.write("\nPermutação das Linhas\n")
+    OUTPUT_FILE.write(f'{[index + 1 for index in diagonal_matrix.permutation]}\n')
     OUTPUT_FILE.write("\nSolução\n")
     write_dict(solution, OUTPUT_FILE)
 
@@ -174,7 +167,7 @@ if __name__ == '__main__':
         data = get_data_from_json(INPUT_PATH)
         solution = gauss_solve(data)
         print(f"Solução encontrada e escrita no arquivo {OUTPUT_PATH}")
-    except SolutionException as ex:
+    except (SolutionException, LinearSystemException) as ex:
         print(ex)
     except KeyError as e:
         print(f"Formato de entrada inválido. Chave faltando: {e}")
@@ -2,20 +2,31 @@ from dataclasses import dataclass
 from enum import Enum
 from io import TextIOWrapper
 import os
+import sys
 import traceback
-from sympy import Eq, solve, sympify, symbols, N
 import json
 from decimal import Decimal, getcontext
 import copy
+import numpy as np
+
+sys.path.append(os.path.realpath(f'{os.path.dirname(os.path.realpath(__file__))}/../../..'))
+
+from common.linear_systems import LU_BLOCK_SIZE, LinearSystemException, LUFactorization, blocked_lu, get_matrix_signature
 
 getcontext().prec = 50
 
+class PrecisionType(Enum):
+    FLOAT = 1
+    DECIMAL = 2
 
 @dataclass
 class MatrixData:
     matrix: list[list[Decimal]]
     variables: list[str]
-    results: list[Decimal]
+    results: list[Decimal] | list[list[Decimal]]
+    factorization_file: str | None = None
+    precision: PrecisionType = PrecisionType.FLOAT
+    block_size: int = LU_BLOCK_SIZE
 
 @dataclass 
 class LUSolution:
@@ -33,12 +44,18 @@ def get_data_from_json(file_path: str):
         data = json.load(json_file)
 
     decimal_matrix = [[Decimal(str(val)) for val in row] for row in data['matrix']]
-    decimal_results = [Decimal(str(val)) for val in data['results']]
+    if isinstance(data['results'][0], list):
+        decimal_results = [[Decimal(str(val)) for val in results] for results in data['results']]
+    else:
+        decimal_results = [Decimal(str(val)) for val in data['results']]
 
     return MatrixData(
         decimal_matrix,
         data['variables'],
-        decimal_results
+        decimal_results,
+        data['factorization_file'] if 'factorization_file' in data else None,
+        PrecisionType[data['precision'].upper()] if 'precision' in data else PrecisionType.FLOAT,
+        data['block_size'] if 'block_size' in data else LU_BLOCK_SIZE
     )
 
 def get_out_file(file_path: str):
@@ -82,49 +99,6 @@ def write_dict(dictionary: dict, file: TextIOWrapper):
     for key, value in dictionary.items():
         file.write(f'{key} = {value}\n')
 
-def solve_function(expression: str, result: Decimal, variable: str):
-    symp_expression = sympify(N(expression, 50))
-    symp_variable = symbols(variable)
-    
-    solutions_sympy = solve(Eq(symp_expression, result), symp_variable)
-    decimal_solutions = [Decimal(str(sol)) for sol in solutions_sympy]
-    
-    return decimal_solutions
-
-def solve_matrix(data: MatrixData, lower: bool = False):
-    invalid_matrix = check_invalid_matrix_by_input(data)
-    if(invalid_matrix):
-        raise(SolutionException(f'Erro: {invalid_matrix}'))
-
-    system: list[str] = []
-    solutions: dict = {}
-    for line_index in range(len(data.matrix)):
-        expression_parts = []
-        for column_index in range(len(data.matrix[line_index])):
-            expression_parts.append(f'({data.matrix[line_index][column_index]} * {data.variables[column_index]})')
-        expression = ' + '.join(expression_parts)
-        system.append(expression)
-    
-    for line_index in (range(len(data.matrix) - 1, -1, -1) if not lower else range(len(data.matrix))):
-        current_expression = system[line_index]
-        variable = data.variables[line_index]
-
-        for key, value in solutions.items():
-            current_expression = current_expression.replace(key, str(value))
-            
-        solution = solve_function(current_expression, data.results[line_index], variable)
-        solutions[variable] = solution[0]
-    
-    return reverse_dict(solutions) if not lower else solutions
-
-def reverse_dict(dictionary: dict):
-    reversed_dictionary = {}
-    while dictionary:
-        key, value = dictionary.popitem()
-        reversed_dictionary[key] = value
-
-    return reversed_dictionary
-
 def check_invalid_matrix(matrix: list):
     if not matrix:
         return "Matriz vazia"
@@ -154,8 +128,8 @@ def get_LU_matrices(data: MatrixData):
         raise(SolutionException(f'Erro: {invalid_matrix}'))
 
     matrix = data.matrix
-    upper_matrix = clear_matrix(copy.deepcopy(data))
-    lower_matrix = clear_matrix(copy.deepcopy(data))
+    upper_matrix = clear_matrix(MatrixData(copy.deepcopy(matrix), data.variables, [Decimal(0)] * len(matrix)))
+    lower_matrix = clear_matrix(MatrixData(copy.deepcopy(matrix), data.variables, [Decimal(0)] * len(matrix)))
 
     upper_matrix.matrix[0] = matrix[0]
 
@@ -200,36 +174,73 @@ def clear_matrix(matrix_data: MatrixData):
     
     return matrix_data
 
-def LU_solve(data: MatrixData):
+def get_factorization(data: MatrixData):
+    if data.precision == PrecisionType.FLOAT:
+        factorization = blocked_lu(np.array(data.matrix, dtype=float), data.block_size)
+        factorization.signature = get_matrix_signature(data.matrix)
+        return factorization
+
     matrices = get_LU_matrices(data)
 
-    matrices.lower.results = data.results
+    return LUFactorization(np.array(matrices.lower.matrix, dtype=object), np.array(matrices.upper.matrix, dtype=object), signature=get_matrix_signature(data.matrix))
+
+def get_result_sets(data: MatrixData):
+    return data.results if isinstance(data.results[0], list) else [data.results]
+
+def LU_solve(data: MatrixData):
+    invalid_matrix = check_invalid_matrix(data.matrix)
+    if(invalid_matrix):
+        raise(SolutionException(f'Erro: {invalid_matrix}'))
+
+    result_sets = get_result_sets(data)
+    if any(len(results) != len(data.matrix) for results in result_sets) or len(data.variables) != len(data.matrix):
+        raise(SolutionException('Erro: Matriz mal formada'))
+
+    factorization_path = f'{os.path.dirname(os.path.realpath(__file__))}/{data.factorization_file}' if data.factorization_file is not None else None
+
+    factorization = None
+    if factorization_path is not None and os.path.exists(factorization_path):
+        factorization = LUFactorization.load(factorization_path)
+        if not factorization.matches(data.matrix, data.precision == PrecisionType.DECIMAL):
+            print(f"A fatoração em {data.factorization_file} não corresponde à matriz de entrada, refatorando")
+            factorization = None
+
+    if factorization is None:
+        factorization = get_factorization(data)
+        if factorization_path is not None:
+            factorization.save(factorization_path)
 
     OUTPUT_FILE.write('Matriz Original:\n')
-    write_matrix(data, OUTPUT_FILE)
-    
+    write_matrix(data, OUTPUT_FILE, only_matrix=len(result_sets) > 1)
+
+    if factorization_path is not None:
+        OUTPUT_FILE.write(f'\nFatoração LU: {data.factorization_file}\n')
+
     OUTPUT_FILE.write('\nMatriz Inferior:\n')
-    write_matrix(matrices.lower, OUTPUT_FILE, only_matrix=True)
+    write_matrix(MatrixData(factorization.lower, data.variables, []), OUTPUT_FILE, only_matrix=True)
     
     OUTPUT_FILE.write('\nMatriz Superior:\n')
-    write_matrix(matrices.upper, OUTPUT_FILE, only_matrix=True)
+    write_matrix(MatrixData(factorization.upper, data.variables, []), OUTPUT_FILE, only_matrix=True)
 
-    OUTPUT_FILE.write('\n----------------------------------------------------------------------------------------\n')
-    
-    OUTPUT_FILE.write(f'\nSolucionando para o conjunto: {[str(value) for value in data.results]}\n')
+    OUTPUT_FILE.write('\nPermutação das Linhas:\n')
+    OUTPUT_FILE.write(f'{[int(index) + 1 for index in factorization.permutation]}\n')
+
+    results = np.array(result_sets, dtype=object if factorization.lower.dtype == object else float).T
+    lower_solutions = factorization.forward(results)
+    upper_solutions = factorization.backward(lower_solutions)
+
+    for index, result_set in enumerate(result_sets):
+        OUTPUT_FILE.write('\n----------------------------------------------------------------------------------------\n')
+        
+        OUTPUT_FILE.write(f'\nSolucionando para o conjunto: {[str(value) for value in result_set]}\n')
+
+        OUTPUT_FILE.write('\nSolução de Ly = Pb:\n')
+        write_dict(dict(zip(data.variables, lower_solutions[:, index])), OUTPUT_FILE)
 
-    lower_solution = solve_matrix(matrices.lower, lower=True)
-    OUTPUT_FILE.write(f'\nMatriz Inferior:\n')
-    write_matrix(matrices.lower, OUTPUT_FILE)
-    OUTPUT_FILE.write('\nSolução:\n')
-    write_dict(lower_solution, OUTPUT_FILE)
+        OUTPUT_FILE.write('\nSolução de Ux = y:\n')
+        write_dict(dict(zip(data.variables, upper_solutions[:, index])), OUTPUT_FILE)
 
-    matrices.upper.results = list(lower_solution.values())
-    upper_solution = solve_matrix(matrices.upper)
-    OUTPUT_FILE.write(f'\nMatriz Superior:\n')
-    write_matrix(matrices.upper, OUTPUT_FILE)
-    OUTPUT_FILE.write('\nSolução:\n')
-    write_dict(upper_solution, OUTPUT_FILE)
+    return upper_solutions
 
 INPUT_PATH = 'input.json'
 OUTPUT_PATH = 'output.txt'
@@ -240,7 +251,7 @@ if __name__ == '__main__':
         data = get_data_from_json(INPUT_PATH)
         solution = LU_solve(data)
         print(f"Solução encontrada e escrita no arquivo {OUTPUT_PATH}")
-    except SolutionException as ex:
+    except (SolutionException, LinearSystemException) as ex:
         print(ex)
     except KeyError as e:
         print(f"Formato de entrada inválido. Chave faltando: {e}")
@@ -3,11 +3,14 @@ from enum import Enum
 from io import TextIOWrapper
 import math
 import os
+import sys
 import traceback
-from sympy import Eq, evalf, solve, sympify, symbols, N
 import json
 from decimal import Decimal, getcontext
-import copy
+
+sys.path.append(os.path.realpath(f'{os.path.dirname(os.path.realpath(__file__))}/../../..'))
+
+from common.expressions import differentiate_expression, solve_expression
 
 getcontext().prec = 50
 
@@ -55,21 +58,22 @@ def write_dict(dictionary: dict, file: TextIOWrapper):
     for key, value in dictionary.items():
         file.write(f'{key} = {value:.15f}\n')
 
-def solve_function(expression: str, variables: dict[str, Decimal]):
-    for key, value in variables.items():
-        expression = expression.replace(key, str(value))
+def get_residual_expression(equation: str):
+    if '=' not in equation:
+        return equation
 
-    left, right = expression.split("=")
-    
-    left_symp = sympify(left)
-    right_symp = sympify(right)
-    
-    symp_expression = Eq(left_symp, right_symp)
-    
-    solutions_sympy = solve(symp_expression)
-    decimal_solutions = [Decimal(eval(str(sol))) for sol in solutions_sympy]
-    
-    return decimal_solutions
+    left, right = equation.split('=')
+
+    return f'({left}) - ({right})'
+
+def solve_function(expression: str, variable: str, values: dict[str, Decimal]):
+    residual = get_residual_expression(expression)
+    coefficient = solve_expression(differentiate_expression(residual, variable), values)
+
+    if coefficient == 0:
+        raise SolutionException(f"A equação {expression} não depende de {variable}")
+
+    return values[variable] - solve_expression(residual, values) / coefficient
 
 def reverse_dict(dictionary: dict):
     reversed_dictionary = {}
@@ -83,11 +87,9 @@ def solve_for_jacobi(data: SystemData, values: dict[str, Decimal]):
     solution: dict[str, Decimal] = {}
 
     for i in range(len(data.expressions)):
-        filtered_values = copy.deepcopy(values)
         expression = data.expressions[i]
         variable = data.variables[i]
-        filtered_values.pop(variable)
-        solution[variable] = solve_function(expression, filtered_values)[0]
+        solution[variable] = solve_function(expression, variable, values)
     
     return solution
 
@@ -0,0 +1,174 @@
+from dataclasses import dataclass
+from enum import Enum
+from io import TextIOWrapper
+import math
+import os
+import sys
+import json
+from decimal import Decimal, getcontext
+
+import numpy as np
+
+sys.path.append(os.path.realpath(f'{os.path.dirname(os.path.realpath(__file__))}/../../..'))
+
+from common.expressions import differentiate_expression, solve_expressions_array
+
+getcontext().prec = 50
+
+class MethodType(Enum):
+    NEWTON = 1
+    BROYDEN = 2
+
+@dataclass
+class InputData:
+    system: list[str]
+    variables: list[str]
+    initial_values: list[Decimal]
+    tolerated_variation: Decimal
+    method: MethodType
+
+@dataclass
+class SystemData:
+    expressions: list[str]
+    jacobian: list[list[str]]
+    variables: list[str]
+
+@dataclass
+class Solution:
+    values: dict[str, Decimal]
+    iterations: int
+    jacobian_evaluations: int
+
+class SolutionException(Exception):
+    def __init__(self, *args):
+        super().__init__(*args)
+
+def get_data_from_json(file_path: str):
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    
+    with open(f'{dir_path}/{file_path}', 'r') as json_file:
+        data = json.load(json_file)
+
+    if len(data['system']) != len(data['variables']) or len(data['variables']) != len(data['initial_values']):
+        raise SolutionException('O sistema deve ter o mesmo número de equações, variáveis e valores iniciais')
+
+    return InputData(
+        data['system'], 
+        data['variables'], 
+        [Decimal(str(value)) for value in data['initial_values']],
+        Decimal(str(data['tolerated_variation'])),
+        MethodType[data['method'].upper()] if 'method' in data else MethodType.NEWTON
+    )
+
+def get_out_file(file_path: str):
+    dir_path = os.path.dirname(os.path.realpath(__file__))
+    file = open(f'{dir_path}/{file_path}', 'w', encoding='UTF-8')
+
+    return file
+
+def write_dict(dictionary: dict, file: TextIOWrapper):
+    for key, value in dictionary.items():
+        file.write(f'{key} = {value:.15f}\n')
+
+def get_residual_expression(equation: str):
+    if '=' not in equation:
+        return equation
+
+    left, right = equation.split('=')
+
+    return f'({left}) - ({right})'
+
+def get_system_data(data: InputData):
+    expressions = [get_residual_expression(equation) for equation in data.system]
+    jacobian = [[differentiate_expression(expression, variable) for variable in data.variables] for expression in expressions]
+
+    return SystemData(expressions, jacobian, data.variables)
+
+def solve_system(system: SystemData, values: np.ndarray, with_jacobian: bool):
+    n = len(system.variables)
+    expressions = tuple(system.expressions) + (tuple(entry for row in system.jacobian for entry in row) if with_jacobian else ())
+    results = solve_expressions_array(expressions, dict(zip(system.variables, values)))
+
+    residuals = np.array([float(result) for result in results[:n]])
+    jacobian = np.array([float(result) for result in results[n:]]).reshape(n, n) if with_jacobian else None
+
+    return residuals, jacobian
+
+def get_step(jacobian: np.ndarray, residuals: np.ndarray):
+    try:
+        return np.linalg.solve(jacobian, -residuals)
+    except np.linalg.LinAlgError:
+        raise SolutionException('Matriz jacobiana singular, não é possível continuar')
+
+def update_broyden_jacobian(jacobian: np.ndarray, step: np.ndarray, residual_change: np.ndarray):
+    return jacobian + np.outer(residual_change - (jacobian @ step), step) / (step @ step)
+
+def newton_solve(data: InputData):
+    system = get_system_data(data)
+    values = np.array([float(value) for value in data.initial_values])
+    tolerance = float(data.tolerated_variation)
+
+    residuals, jacobian = solve_system(system, values, True)
+    jacobian_evaluations = 1
+
+    OUTPUT_FILE.write(f'Método: {data.method.name.lower()}\n\nValores Iniciais\n')
+    write_dict(dict(zip(data.variables, values)), OUTPUT_FILE)
+
+    abs_variation = [math.inf]
+    iteration = 1
+    while max(abs_variation) > tolerance and iteration <= MAX_ITERATIONS:
+        step = get_step(jacobian, residuals)
+        if not np.all(np.isfinite(step)):
+            raise SolutionException('O método divergiu')
+
+        values = values + step
+        abs_variation = np.abs(step)
+        converged = max(abs_variation) <= tolerance
+        with_jacobian = data.method == MethodType.NEWTON and not converged
+        new_residuals, new_jacobian = solve_system(system, values, with_jacobian)
+
+        if with_jacobian:
+            jacobian = new_jacobian
+            jacobian_evaluations += 1
+        elif not converged:
+            jacobian = update_broyden_jacobian(jacobian, step, new_residuals - residuals)
+
+        residuals = new_residuals
+
+        OUTPUT_FILE.write(f'\nIteração {iteration}\n')
+        OUTPUT_FILE.write('\nSolução\n')
+        write_dict(dict(zip(data.variables, values)), OUTPUT_FILE)
+        OUTPUT_FILE.write('\nVariação Absoluta: ')
+        OUTPUT_FILE.write(f'[{", ".join(["{:.15f}".format(value) for value in abs_variation])}]')
+        OUTPUT_FILE.write(f'\nMaior variação absoluta: {max(abs_variation):.15f}')
+        OUTPUT_FILE.write(f'\nMaior resíduo: {max(np.abs(residuals)):.15f}')
+        OUTPUT_FILE.write('\n\n----------------------------------------------------------\n')
+
+        iteration += 1
+
+    if(iteration > MAX_ITERATIONS):
+        OUTPUT_FILE.write(f'\nNão foi possível convergir em {MAX_ITERATIONS} iterações\n')
+    else:
+        OUTPUT_FILE.write(f'\nVariação menor do que a tolerada, resultado encontrado na iteração {iteration - 1}\n')
+    OUTPUT_FILE.write(f'Avaliações da matriz jacobiana: {jacobian_evaluations}\n')
+
+    return Solution(dict(zip(data.variables, [Decimal(str(value)) for value in values])), iteration - 1, jacobian_evaluations)
+
+INPUT_PATH = 'input.json'
+OUTPUT_PATH = 'output.txt'
+OUTPUT_FILE = get_out_file(OUTPUT_PATH)
+MAX_ITERATIONS = 9999
+
+if __name__ == '__main__':
+    try:
+        data = get_data_from_json(INPUT_PATH)
+        solution = newton_solve(data)
+        print(f"Solução encontrada e escrita no arquivo {OUTPUT_PATH}")
+    except SolutionException as ex:
+        print(ex)
+    except KeyError as e:
+        print(f"Formato de entrada inválido. Chave faltando: {e}")
+    except Exception as e:
+        print(f'Erro ao solucionar o problema: {e}')
+    
+    OUTPUT_FILE.close()
@@ -3,9 +3,13 @@ from decimal import Decimal, getcontext
 import matplotlib.pyplot as plt
 import json
 import os
+import sys
 
 import numpy as np
-from sympy import N, sqrt, symbols, sympify
+
+sys.path.append(os.path.realpath(f'{os.path.dirname(os.path.realpath(__file__))}/../../..'))
+
+from common.expressions import solve_expression
 
 getcontext().prec = 50
 
@@ -113,10 +117,7 @@ def get_data_from_json(file_path: str):
 
 
 def solve_function(function: Function, variable_value: Decimal):
-    symp_expression = sympify(function.expression)
-    symp_variable = symbols(function.variable)
-
-    return Decimal(str(N(symp_expression.evalf(subs={symp_variable: variable_value}))))
+    return solve_expression(function.expression, {function.variable: variable_value})
 
 
 def calc_1st_order_differential(points: list[Point], h: Decimal):
@@ -4,8 +4,11 @@ import math
 import traceback
 import json
 import os
+import sys
 
-import sympy as sp
+sys.path.append(os.path.realpath(f'{os.path.dirname(os.path.realpath(__file__))}/../../..'))
+
+from common.expressions import solve_expression
 
 getcontext().prec = 50
 
@@ -93,10 +96,7 @@ def get_data_from_json(file_path: str):
     )
 
 def solve_function(function: Function, variable_value: Decimal):
-    symp_expression = sp.sympify(function.expression)
-    symp_variable = sp.symbols(function.variable)
-
-    return Decimal(str(sp.N(symp_expression.evalf(subs={symp_variable: variable_value}))))
+    return solve_expression(function.expression, {function.variable: variable_value})
 
 def calc_integral_by_trapeziums(function: Function, points: list[Decimal], n: Decimal):
     a = points[0]
@@ -1,10 +1,13 @@
-import copy
 from dataclasses import dataclass
 from decimal import Decimal
 import json
 import os
+import sys
 import numpy as np
-from sympy import Eq, solve, symbols, sympify
+
+sys.path.append(os.path.realpath(f'{os.path.dirname(os.path.realpath(__file__))}/../../..'))
+
+from common.linear_systems import LinearSystemException, back_substitution, forward_elimination, to_array
 
 
 class SolutionException(Exception):
@@ -101,56 +104,17 @@ def get_matrix(data: InputData, vectors: list[list[Decimal]]):
 
     return Matrix(matrix, variables, result)
 
-def solve_function(expression: str, result: float, variable: str):
-    symp_expression = sympify(expression)
-    symp_variable = symbols(variable)
-    
-    return solve(Eq(symp_expression, result), symp_variable)
-
 def solve_matrix(data: Matrix):
-    system: list[str] = []
-    solutions: dict[str, Decimal] = {}
-    for line_index in range(len(data.matrix)):
-        expression_parts = []
-        for column_index in range(len(data.matrix[line_index])):
-            expression_parts.append(f'({data.matrix[line_index][column_index]} * {data.variables[column_index]})')
-        expression = ' + '.join(expression_parts)
-        system.append(expression)
-    
-    for line_index in range(len(data.matrix) - 1, -1, -1):
-        variable = data.variables[line_index]
-        for key, value in solutions.items():
-            system[line_index] = system[line_index].replace(key, str(value))
-            
-        solution = solve_function(system[line_index], data.result[line_index], variable)
-        solutions[variable] = solution[0]
+    solution = back_substitution(data.matrix, data.result)
 
-    solutions = reverse_dict(solutions)
-    
-    return solutions
-
-def reverse_dict(dictionary: dict):
-    reversed_dictionary = {}
-    while dictionary:
-        key, value = dictionary.popitem()
-        reversed_dictionary[key] = value
-
-    return reversed_dictionary
+    return dict(zip(data.variables, solution.tolist()))
 
 def get_diagonal_matrix(input_data: Matrix):
-    data = copy.deepcopy(input_data)
+    matrix = to_array(input_data.matrix)
+    result = to_array(input_data.result)
+    forward_elimination(matrix, result)
 
-    for iteration_line_index in range(1, len(data.matrix)):
-        for line_index in range(iteration_line_index, len(data.matrix)):
-            m = data.matrix[line_index][iteration_line_index - 1] / data.matrix[iteration_line_index - 1][iteration_line_index - 1]
-            data.matrix[line_index][iteration_line_index - 1] = 0
-
-            for column_index in range(iteration_line_index, len(data.matrix[iteration_line_index])):
-                data.matrix[line_index][column_index] = data.matrix[line_index][column_index] - (m * data.matrix[iteration_line_index - 1][column_index])
-            
-            data.result[line_index] = data.result[line_index] - (m * data.result[iteration_line_index - 1])
-    
-    return data
+    return Matrix(matrix, input_data.variables, result)
 
 def gauss_solve(data: Matrix):
     diagonal_matrix = get_diagonal_matrix(data)
@@ -196,7 +160,7 @@ if __name__ == '__main__':
         output_file.writelines([str(matrix_solution), '\n\n'])
         output_file.writelines([expression, '\n\n'])
         output_file.close()
-    except SolutionException as ex:
+    except (SolutionException, LinearSystemException) as ex:
         print(ex)
     except KeyError as e:
         print(f"Formato de entrada inválido. Chave faltando: {e}")
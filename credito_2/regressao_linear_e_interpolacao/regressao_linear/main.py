@@ -2,8 +2,13 @@ from dataclasses import dataclass
 from decimal import Decimal, getcontext
 import json
 import os
+import sys
 
-from sympy import N, sqrt, symbols, sympify
+from sympy import sqrt
+
+sys.path.append(os.path.realpath(f'{os.path.dirname(os.path.realpath(__file__))}/../../..'))
+
+from common.expressions import solve_expression
 
 getcontext().prec = 50
 
@@ -57,10 +62,7 @@ def get_data_from_json(file_path: str):
     )
 
 def solve_function(function: Function, variable_value: Decimal):
-    symp_expression = sympify(function.expression)
-    symp_variable = symbols(function.variable)
-
-    return Decimal(str(N(symp_expression.evalf(subs={symp_variable: variable_value}))))
+    return solve_expression(function.expression, {function.variable: variable_value})
 
 def linear_regression(key_value_pairs: list[KeyValuePair]):
     n: int = len(key_value_pairs)
@@ -6,8 +6,11 @@ import json
 import os
 
 import numpy as np
-from sympy import N, collect, expand, simplify, symbols, sympify
+from sympy import collect, expand, simplify, symbols
 
+sys.path.append(os.path.realpath(f'{os.path.dirname(os.path.realpath(__file__))}/../../..'))
+
+from common.expressions import solve_expression
 from models.Point import Point
 from models.Coefficients import Coefficients
 from models.InputData import InputData
@@ -114,7 +117,7 @@ def create_analytical_solution_points(input_data: InputData):
 
     for i in range(input_data.points + 1):
         x = Decimal(a) + h * i
-        points.append(Point(x, Decimal(str(N(sympify(input_data.analytical_solution).evalf(subs={"x": x}))))))
+        points.append(Point(x, solve_expression(input_data.analytical_solution, {"x": x})))
     
     return points
 
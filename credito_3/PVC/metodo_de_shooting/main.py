@@ -9,8 +9,10 @@ import sys
 import traceback
 
 from matplotlib import pyplot as plt
-from sympy import N, sympify
 
+sys.path.append(os.path.realpath(f'{os.path.dirname(os.path.realpath(__file__))}/../../..'))
+
+from common.expressions import solve_expression
 from models.InputData import InputData
 from models.Function import Function
 from models.Point import Point
@@ -137,7 +139,7 @@ def create_analytical_solution_points(input_data: InputData):
 
     for i in range(input_data.points + 1):
         x = Decimal(input_data.interval[0]) + h * i
-        points.append(Point(x, Decimal(str(N(sympify(input_data.analytical_solution).evalf(subs={input_data.control_variable: x}))))))
+        points.append(Point(x, solve_expression(input_data.analytical_solution, {input_data.control_variable: x})))
     
     return points
 
@@ -1,5 +1,5 @@
 from decimal import Decimal, getcontext
-from sympy import N, symbols, sympify
+from common.expressions import solve_expression
 from models.Function import Function
 
 class EulerModificado:
@@ -9,9 +9,7 @@ class EulerModificado:
     getcontext().prec = 50
 
     def solve_function(self, function: Function, subs: dict[str, Decimal]):
-        symp_expression = sympify(function.expression)
-
-        return Decimal(str(N(symp_expression.evalf(subs=subs))))
+        return solve_expression(function.expression, subs)
 
     def get_middle_value(self, values: dict[str, Decimal], function: Function, h: Decimal):
         f_xy = self.solve_function(function, values)
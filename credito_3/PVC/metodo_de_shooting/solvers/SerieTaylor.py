@@ -1,5 +1,6 @@
 from decimal import Decimal, getcontext
-from sympy import N, diff, symbols, sympify
+from sympy import diff
+from common.expressions import solve_expression
 from models.Function import Function
 
 class SerieTaylor:
@@ -9,8 +10,7 @@ class SerieTaylor:
     getcontext().prec = 50
 
     def solve_function(self, function: Function, subs: dict[str, Decimal]):
-        symp_expression = sympify(function.expression)
-        return Decimal(str(N(symp_expression.evalf(subs=subs))))
+        return solve_expression(function.expression, subs)
 
     def diff_y(self, function: Function, control_variable: str):
         diff_x = diff(function.expression, control_variable)
@@ -1,5 +1,5 @@
 from decimal import Decimal, getcontext
-from sympy import N, symbols, sympify
+from common.expressions import solve_expression
 from models.Function import Function
 
 class Heun:
@@ -9,9 +9,7 @@ class Heun:
     getcontext().prec = 50
 
     def solve_function(self, function: Function, subs: dict[str, Decimal]):
-        symp_expression = sympify(function.expression)
-
-        return Decimal(str(N(symp_expression.evalf(subs=subs))))
+        return solve_expression(function.expression, subs)
 
 
     def predict_next_value(self, values: dict[str, Decimal], function: Function, h: Decimal):  
@@ -1,5 +1,5 @@
 from decimal import Decimal, getcontext
-from sympy import N, sympify
+from common.expressions import solve_expression
 from models.Function import Function
 
 class RungeKutta2:
@@ -9,8 +9,7 @@ class RungeKutta2:
     getcontext().prec = 50
 
     def solve_function(self, function: Function, subs: dict[str, Decimal]):
-        symp_expression = sympify(function.expression)
-        return Decimal(str(N(symp_expression.evalf(subs=subs))))
+        return solve_expression(function.expression, subs)
 
     def get_k1(self, function: Function, values: dict[str, Decimal]):
         return self.solve_function(function, values)